@@ -3,15 +3,19 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any
-import requests
+import httpx
+import logging
+import orjson
 import os
-import json
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
 import asyncio
-from fastapi.responses import JSONResponse
-from fastapi import FastAPI, HTTPException, Request  # Add Request here
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -20,12 +24,14 @@ root_dir = Path(__file__).parent.parent
 sys.path.append(str(root_dir))
 
 # Now use absolute imports
-from scripts.ticker_manager import TickerManager
+from scripts.ticker_manager import TickerManager, POLYGON_BASE_URL
 from scripts.progress_tracker import get_progress_tracker
-from scripts.polygon_fetch import main as fetch_data
+from scripts.collect import collect_with_progress
 
 progress_tracker = get_progress_tracker()
 
+logger = logging.getLogger(__name__)
+
 
 # Load environment variables from known production path
 env_path = Path("/opt/biotech-dashboard/.env")
@@ -34,9 +40,43 @@ load_dotenv(env_path)
 POLYGON_KEY = os.getenv('POLYGON_API_KEY')
 
 
+# Seconds between keepalive comments on an otherwise idle refresh event stream
+SSE_KEEPALIVE_SECONDS = 15
+
+# Raw market_data.json bytes, keyed by the file's (mtime, size) when they were read
+_market_data_cache: Dict[str, Any] = {"version": None, "payload": b""}
+
+
+# Collector process pool and the multiprocessing manager serving its progress queues, set up in lifespan
+_collector: Dict[str, Any] = {"pool": None, "manager": None}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One async client per process so Polygon.io searches reuse keep-alive connections and never block the event loop.
+    # HTTP/2 multiplexes concurrent searches over a single TLS connection.
+    app.state.polygon_client = httpx.AsyncClient(
+        base_url=POLYGON_BASE_URL,
+        params={"apiKey": POLYGON_KEY},
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        # Sized for a burst of typeahead searches; idle connections stay warm between bursts
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60.0),
+        headers={"User-Agent": "biotech-monitor/1.0"}
+    )
+    manager.http = app.state.polygon_client
+    # Market data collection gets a dedicated process so its CPU work never competes with request handling.
+    # Spawned (not forked) so the child doesn't inherit the event loop or the server's threads.
+    mp_context = multiprocessing.get_context("spawn")
+    _collector["pool"] = ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+    _collector["manager"] = await asyncio.to_thread(mp_context.Manager)
+    yield
+    _collector["pool"].shutdown(wait=False, cancel_futures=True)
+    _collector["manager"].shutdown()
+    await app.state.polygon_client.aclose()
+    manager.close()
 
 # Initialize FastAPI app once
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # In server.py, update the CORS middleware configuration
 origins = [
@@ -91,27 +131,8 @@ class TickerDetail(BaseModel):
 async def get_tickers():
     """Get all tracked tickers"""
     try:
-        print("Fetching tickers...")  # Debug log
-        tickers = manager.get_tickers()
-        print(f"Found tickers: {tickers}")  # Debug log
-        details = manager.get_ticker_details()
-        print(f"Found details: {details}")  # Debug log
-        
-        response = []
-        for symbol in tickers:
-            detail = details.get(symbol, {})
-            response.append({
-                "symbol": symbol,
-                "name": detail.get("name", ""),
-                "sector": detail.get("sector", ""),
-                "industry": detail.get("industry", ""),
-                "names": detail.get("names", {})
-            })
-        
-        print(f"Returning {len(response)} tickers")  # Debug log
-        return {"tickers": response}
+        return Response(content=manager.cached_tickers_response(), media_type="application/json")
     except Exception as e:
-        print(f"Error in get_tickers: {str(e)}")  # Debug log
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/search")
@@ -120,29 +141,23 @@ async def search_tickers(query: str):
     if len(query.strip()) < 2:
         return {"results": []}
         
-    results = []
-    stored_details = manager.get_ticker_details()
     query = query.upper().strip()
     
-    # First, search through stored tickers
-    for symbol, info in stored_details.items():
-        if any([
-            query in symbol.upper(),
-            query in info.get('name', '').upper(),
-            query in info.get('sector', '').upper(),
-            query in info.get('industry', '').upper()
-        ]):
-            results.append({
-                'symbol': symbol,
-                'name': info.get('name', ''),
-                'sector': info.get('sector', 'Unknown'),
-                'industry': info.get('industry', 'Unknown'),
-                'isTracked': True
-            })
+    # First, search through stored tickers (in-memory index, no file read)
+    results = [
+        {
+            'symbol': symbol,
+            'name': info.get('name', ''),
+            'sector': info.get('sector', 'Unknown'),
+            'industry': info.get('industry', 'Unknown'),
+            'isTracked': True
+        }
+        for symbol, info in manager.match_stored(query)
+    ]
     
     # Then search Polygon API if we have fewer than 10 results
     if len(results) < 10:
-        polygon_results = search_polygon(query)
+        polygon_results = await manager.polygon_search(query)
         tracked_symbols = {r['symbol'] for r in results}
         new_results = [
             {**r, 'isTracked': False} 
@@ -155,13 +170,20 @@ async def search_tickers(query: str):
 
 @app.post("/api/tickers")
 async def add_ticker(ticker: TickerSymbol):
-    if manager.add_ticker(ticker.symbol):
+    # Validation hits Polygon.io and yfinance synchronously; keep it off the event loop
+    if await asyncio.to_thread(manager.add_ticker, ticker.symbol):
         return {"success": True}
     raise HTTPException(status_code=400, detail="Failed to add ticker")
 
+@app.post("/api/tickers/bulk")
+async def add_tickers(tickers: List[TickerSymbol]):
+    """Add several tickers in one request; lookups run concurrently and tickers.json is saved once"""
+    results = await asyncio.to_thread(manager.add_tickers, [ticker.symbol for ticker in tickers])
+    return {"success": all(results.values()), "results": results}
+
 @app.delete("/api/tickers/{symbol}")
 async def remove_ticker(symbol: str):
-    if manager.remove_ticker(symbol):
+    if await asyncio.to_thread(manager.remove_ticker, symbol):
         return {"success": True}
     raise HTTPException(status_code=400, detail="Failed to remove ticker")
 
@@ -170,22 +192,31 @@ async def get_market_data():
     """Get current market data for all tracked stocks"""
     try:
         market_data_path = get_project_root() / "data" / "market_data.json"
-        print(f"Looking for market data at: {market_data_path}")
+        logger.debug("Looking for market data at: %s", market_data_path)
         
-        if not market_data_path.exists():
-            possible_locations = list(Path(os.getcwd()).rglob("market_data.json"))
-            print(f"Found market_data.json files in: {possible_locations}")
+        try:
+            stat = market_data_path.stat()
+        except FileNotFoundError:
+            # Walking the working tree is only worth it when someone is debugging a misplaced file
+            if logger.isEnabledFor(logging.DEBUG):
+                possible_locations = list(Path(os.getcwd()).rglob("market_data.json"))
+                logger.debug("Found market_data.json files in: %s", possible_locations)
             raise HTTPException(
                 status_code=404,
                 detail=f"Market data file not found at {market_data_path}"
             )
-            
-        with open(market_data_path, 'r') as f:
-            data = json.load(f)
-        return data
         
+        # The file only changes when a refresh replaces it, so serve the cached bytes until then
+        version = (stat.st_mtime_ns, stat.st_size)
+        if _market_data_cache["version"] != version:
+            payload = await asyncio.to_thread(market_data_path.read_bytes)
+            _market_data_cache.update(version=version, payload=payload)
+        return Response(content=_market_data_cache["payload"], media_type="application/json")
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error accessing market data: {str(e)}")
+        logger.error("Error accessing market data: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/market-data/refresh/status")
@@ -193,8 +224,42 @@ async def get_refresh_status():
     """Get the current status of market data refresh"""
     return progress_tracker.get_status()
 
+@app.get("/api/market-data/refresh/events")
+async def stream_refresh_status(request: Request):
+    """Stream refresh status as Server-Sent Events whenever the progress tracker changes"""
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    
+    # The tracker is updated from the collector's worker threads
+    def on_change():
+        loop.call_soon_threadsafe(changed.set)
+    
+    async def event_stream():
+        progress_tracker.add_listener(on_change)
+        try:
+            last_status = None
+            while not await request.is_disconnected():
+                status = progress_tracker.get_status()
+                if status != last_status:
+                    last_status = status
+                    yield b"data: " + orjson.dumps(status) + b"\n\n"
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=SSE_KEEPALIVE_SECONDS)
+                    changed.clear()
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield b": keepalive\n\n"
+        finally:
+            progress_tracker.remove_listener(on_change)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/market-data/refresh")
-async def refresh_market_data():
+async def refresh_market_data(background_tasks: BackgroundTasks):
     """Trigger a refresh of market data"""
     try:
         if progress_tracker.is_running:
@@ -206,11 +271,12 @@ async def refresh_market_data():
                 status_code=409
             )
         
-        # Reset the tracker before starting new collection
-        progress_tracker.reset()
+        # Mark the run as started before responding, so a second POST gets the 409 above
+        # instead of queueing another collection behind this one
+        progress_tracker.start_collection(len(manager.get_tickers()))
         
-        # Create task
-        asyncio.create_task(run_data_collection())
+        # Runs once the response is sent; Starlette holds the task, unlike a bare create_task
+        background_tasks.add_task(run_data_collection)
         
         return JSONResponse(
             content={
@@ -231,17 +297,27 @@ async def refresh_market_data():
             status_code=500
         )
 
+async def relay_collector_progress(progress_queue):
+    """Mirror tracker snapshots sent by the collector process until a None sentinel arrives"""
+    while True:
+        state = await asyncio.to_thread(progress_queue.get)
+        if state is None:
+            return
+        progress_tracker.restore(state)
+
 async def run_data_collection():
     """Run the data collection process"""
     try:
-        # Get list of tickers to process
-        tickers = manager.get_tickers()
-        total_tickers = len(tickers)
-        
-        # Start collection with total tickers count
-        progress_tracker.start_collection(total_tickers)
-        
-        success = await asyncio.to_thread(fetch_data)
+        # The refresh endpoint already started the tracker.
+        # The collector runs in its own process (and GIL); its progress is relayed back through a queue
+        progress_queue = _collector["manager"].Queue()
+        relay = asyncio.create_task(relay_collector_progress(progress_queue))
+        try:
+            loop = asyncio.get_running_loop()
+            success = await loop.run_in_executor(_collector["pool"], collect_with_progress, progress_queue)
+        finally:
+            progress_queue.put(None)
+            await relay
         
         if success:
             progress_tracker.complete()
@@ -254,33 +330,9 @@ async def run_data_collection():
         progress_tracker.set_error(error_msg)
         return False
 
-def search_polygon(query: str) -> List[Dict[str, Any]]:
-    """Search for tickers using Polygon.io API"""
-    try:
-        base_url = "https://api.polygon.io"
-        endpoint = f"/v3/reference/tickers"
-        url = f"{base_url}{endpoint}?search={query}&active=true&limit=10&apiKey={POLYGON_KEY}"
-        
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data and 'results' in data:
-            return [{
-                'symbol': item.get('ticker', ''),
-                'name': item.get('name', ''),
-                'sector': item.get('sic_sector', ''),
-                'industry': item.get('sic_industry', '')
-            } for item in data['results']]
-    except Exception as e:
-        print(f"Polygon search error: {str(e)}")
-        return []
-    
-    return []
-
 @app.exception_handler(Exception)
 async def generic_exception_handler(request, exc):
-    print(f"Unhandled exception: {str(exc)}")
+    logger.error("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"status": "error", "message": str(exc)}
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """
+    Persistent JSON cache with per-lookup TTLs.
+    Each entry is stored as {cache_dir}/{md5(key)}.json containing {"ts": epoch, "data": ...}
+    """
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._counts = {'hits': 0, 'misses': 0, 'writes': 0}
+        self._counts_lock = threading.Lock()
+
+    def _count(self, name: str):
+        with self._counts_lock:
+            self._counts[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/write counts since the cache was created"""
+        with self._counts_lock:
+            return dict(self._counts)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """Build a stable cache key from an endpoint and its query parameters"""
+        items = sorted((k, v) for k, v in (params or {}).items() if k != 'apiKey')
+        return f"{endpoint}?{urlencode(items)}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str, ttl: float) -> Any:
+        """Return the cached value for key if it is younger than ttl seconds, else None"""
+        path = self._path(key)
+        try:
+            with path.open('r') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._count('misses')
+            return None
+        if time.time() - entry.get('ts', 0) >= ttl:
+            self._count('misses')
+            return None
+        self._count('hits')
+        return entry.get('data')
+
+    def set(self, key: str, data: Any):
+        """Store a value, writing atomically so concurrent readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'ts': time.time(), 'data': data}, f)
+            os.replace(tmp_path, self._path(key))
+            self._count('writes')
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry for {key}: {str(e)}")
+            Path(tmp_path).unlink(missing_ok=True)
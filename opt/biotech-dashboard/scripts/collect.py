@@ -0,0 +1,27 @@
+try:
+    from .progress_tracker import get_progress_tracker
+except ImportError:
+    from progress_tracker import get_progress_tracker
+
+
+def collect_with_progress(progress_queue) -> bool:
+    """
+    Run a full market data collection in a worker process, putting a tracker
+    snapshot on progress_queue after every progress change so the parent can mirror it
+    """
+    try:
+        from .polygon_fetch import main as fetch_data
+    except ImportError:
+        from polygon_fetch import main as fetch_data
+    
+    tracker = get_progress_tracker()
+    
+    def relay():
+        progress_queue.put(tracker.snapshot())
+    
+    # The pool reuses this process across refreshes; drop the listener so old queues aren't fed or kept alive
+    tracker.add_listener(relay)
+    try:
+        return fetch_data()
+    finally:
+        tracker.remove_listener(relay)
@@ -0,0 +1,45 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True)
+def rsi_wilder(close: np.ndarray, n: int) -> np.ndarray:
+    """
+    Wilder-smoothed RSI for each close; the first n values are NaN.
+    The recursive smoothing can't be vectorized, so it runs as a compiled loop when numba is available.
+    """
+    out = np.full(close.shape[0], np.nan)
+    if close.shape[0] <= n:
+        return out
+
+    # Branchless split of the day-over-day changes into gains and losses
+    change = np.diff(close)
+    gains = np.maximum(change, 0.0)
+    losses = np.maximum(-change, 0.0)
+
+    avg_gain = gains[:n].mean()
+    avg_loss = losses[:n].mean()
+    out[n] = _rsi_from_averages(avg_gain, avg_loss)
+
+    for i in range(n, change.shape[0]):
+        avg_gain = (avg_gain * (n - 1) + gains[i]) / n
+        avg_loss = (avg_loss * (n - 1) + losses[i]) / n
+        out[i + 1] = _rsi_from_averages(avg_gain, avg_loss)
+    return out
+
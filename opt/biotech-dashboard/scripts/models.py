@@ -0,0 +1,167 @@
+"""
+Shapes of the records the collector builds and writes to market_data.json.
+These are TypedDicts, so they document and type-check the dicts without changing
+what is stored or how it is serialized.
+"""
+from typing import Any, Dict, List, Optional, TypedDict
+
+
+class InsiderTotals(TypedDict):
+    sales: float
+    purchases: float
+    awards: float
+
+
+class InsiderCounts(TypedDict):
+    total_sales: int
+    total_purchases: int
+    total_awards: int
+    sales_count: int
+    purchases_count: int
+    awards_count: int
+    total_value: InsiderTotals
+
+
+class NotableTrade(TypedDict):
+    date: str
+    insider: str
+    position: str
+    type: str
+    shares: int
+    value: float
+    price_per_share: float
+
+
+class InsiderSummary(TypedDict):
+    recent_trades: int
+    net_shares: int
+    notable_trades: List[NotableTrade]
+    summary: InsiderCounts
+    latest_date: Optional[str]
+
+
+class PERatios(TypedDict):
+    trailingPE: Optional[float]
+    forwardPE: Optional[float]
+
+
+class EstimateSet(TypedDict):
+    nextQuarter: Optional[float]
+    currentYear: Optional[float]
+    nextYear: Optional[float]
+
+
+class Estimates(TypedDict):
+    revenue: EstimateSet
+    earnings: EstimateSet
+
+
+class QuarterlyMetrics(TypedDict):
+    revenue: List[float]
+    revenueChange: List[Optional[float]]
+    periods: List[str]
+
+
+class FinancialMetrics(TypedDict):
+    peRatios: PERatios
+    estimates: Estimates
+    quarterly: QuarterlyMetrics
+
+
+class DetailedFinancials(TypedDict):
+    revenue: List[float]
+    revenueChanges: List[Optional[float]]
+    netIncome: List[float]
+    netIncomeChanges: List[Optional[float]]
+    operatingMargin: List[float]
+    operatingMarginChanges: List[Optional[float]]
+    freeCashFlow: List[float]
+    freeCashFlowChanges: List[Optional[float]]
+    dates: List[str]
+
+
+class VolumeMetrics(TypedDict):
+    current_volume: float
+    prev_volume: float
+    sma: Optional[float]
+    recent_volumes: List[float]
+    volume_dates: List[str]
+    daily_changes: List[float]
+    current_ratio: Optional[float]
+    volume_24h_change: float
+    volume_vs_avg: float
+    days_included: int
+
+
+class CompanyNames(TypedDict):
+    long: Optional[str]
+    short: Optional[str]
+    polygon: Optional[str]
+
+
+class Branding(TypedDict):
+    icon_url: Optional[str]
+    logo_url: Optional[str]
+
+
+class RecordVolumeMetrics(TypedDict):
+    recentVolumes: List[float]
+    volumeDates: List[str]
+    dailyChanges: List[float]
+    averageVolume: Optional[float]
+    volumeChange: float
+    volumeVsAvg: float
+
+
+class Technicals(TypedDict):
+    rsi: Optional[float]
+    volumeSMA: Optional[float]
+
+
+class Fundamentals(TypedDict):
+    peRatios: PERatios
+    estimates: Estimates
+    quarterlyMetrics: QuarterlyMetrics
+    detailedQuarterly: DetailedFinancials
+
+
+class AlertDetails(TypedDict):
+    priceAlert: bool
+    volumeSpike10: bool
+    volumeSpike20: bool
+    highVolume: bool
+    insiderAlert: bool
+    newsAlert: bool
+    technicalAlert: bool
+    nearHighAlert: bool
+
+
+class MarketRecord(TypedDict):
+    """One symbol's entry in market_data.json"""
+    symbol: str
+    timestamp: str
+    names: CompanyNames
+    sector: Optional[str]
+    industry: Optional[str]
+    description: Optional[str]
+    branding: Branding
+    investing_url: Optional[str]
+    price: float
+    priceChange: float
+    openPrice: float
+    prevClose: float
+    dayHigh: float
+    dayLow: float
+    volume: float
+    prevVolume: float
+    volumeMetrics: RecordVolumeMetrics
+    technicals: Technicals
+    fiftyTwoWeekHigh: Optional[float]
+    fiftyTwoWeekLow: Optional[float]
+    highProximityPct: Optional[float]
+    marketCap: float
+    insiderActivity: InsiderSummary
+    recentNews: List[Dict[str, Any]]
+    fundamentals: Fundamentals
+    alerts: int
+    alertDetails: AlertDetails
@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dt_time
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
 import time
-import json
+import orjson
 import logging
-from typing import Dict, List, Any
-from ratelimit import limits, sleep_and_retry
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
-import math
+import numpy as np
+import re
+import threading
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
 import os
+import fcntl
 
 
 def get_project_root() -> Path:
@@ -37,10 +46,16 @@ try:
     # Try relative imports first (when running as module)
     from .progress_tracker import get_progress_tracker
     from .ticker_manager import TickerManager
+    from .cache import FileCache
+    from .indicators import rsi_wilder
+    from .models import DetailedFinancials, FinancialMetrics, InsiderSummary, MarketRecord, VolumeMetrics
 except ImportError:
     # Fall back to regular imports (when running as script)
     from progress_tracker import get_progress_tracker
     from ticker_manager import TickerManager
+    from cache import FileCache
+    from indicators import rsi_wilder
+    from models import DetailedFinancials, FinancialMetrics, InsiderSummary, MarketRecord, VolumeMetrics
 
 progress_tracker = get_progress_tracker()
 
@@ -55,82 +70,516 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts for Polygon.io requests
+REQUEST_TIMEOUT = (5, 30)
+
+# Number of symbols processed concurrently
+MAX_WORKERS = int(os.getenv('FETCH_MAX_WORKERS', '8'))
+
+# Calls issued in parallel per symbol (Polygon daily bars, news; yfinance insiders, financials)
+REQUEST_FANOUT = 4
+
+# Client-side Polygon.io rate limit (sustained requests per second and burst size)
+POLYGON_RATE = float(os.getenv('POLYGON_RATE_LIMIT', '5'))
+POLYGON_BURST = int(os.getenv('POLYGON_BURST', '10'))
+
+# Maximum Polygon.io requests in flight at once across all worker threads
+POLYGON_MAX_INFLIGHT = int(os.getenv('POLYGON_MAX_INFLIGHT', '16'))
+
+# Daily bars only move between the US open and a settle time shortly after the close.
+# Outside that window a cached aggregate response stays fresh until the next session opens.
+AGGS_PREFIX = '/v2/aggs/'
+MARKET_TZ = ZoneInfo('America/New_York')
+MARKET_OPEN = dt_time(9, 30)
+MARKET_SETTLE = dt_time(17, 0)
+
+# Seconds a cached Polygon.io response stays fresh, by endpoint prefix.
+# Reference data changes slowly; prices are kept short so refreshes stay current.
+POLYGON_CACHE_TTLS = [
+    ('/v3/reference/tickers/', 24 * 3600),
+    ('/v2/reference/news', 15 * 60),
+    (AGGS_PREFIX, 5 * 60),
+]
+INSIDER_CACHE_TTL = 6 * 3600
+# yfinance info (names, sector, PE ratios, estimates, 52-week range) is slow to scrape, but its price-derived
+# fields move intraday. Like daily bars it expires quickly in a session and lasts from the settle to the next open.
+YF_INFO_CACHE_TTL = 5 * 60
+
+# RSI period in trading days; the smoothing warms up over the whole DAILY_BARS_DAYS series
+RSI_PERIOD = 14
+
+# Calendar days of daily bars fetched per symbol; price change, volume metrics and RSI all read this one series
+DAILY_BARS_DAYS = 90
+
+# Most recent notable (>= $100k) insider trades kept per symbol
+MAX_NOTABLE_TRADES = 50
+
+# Seconds to back off after a 429 when Polygon.io doesn't send a usable Retry-After
+DEFAULT_RETRY_AFTER = 60
+
+# Maximum number of responses memoized in-process per fetcher
+MEMO_MAX_ENTRIES = 1024
+
+# market_data.json serialization (numpy scalars/arrays are written natively).
+# Records are compact, one per line; the file is only ever read by machines.
+MARKET_DATA_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# Polygon.io endpoint paths, formatted per request
+DAILY_AGGS_PATH = "/v2/aggs/ticker/{symbol}/range/1/day/{start}/{end}"
+# Split-adjusted bars, oldest first; the indicators index from the end and rely on that order.
+# Polygon has no field selection on aggregates, so these just pin the defaults the parsing assumes.
+DAILY_AGGS_PARAMS = {'adjusted': 'true', 'sort': 'asc'}
+TICKER_DETAILS_PATH = "/v3/reference/tickers/{symbol}"
+NEWS_PATH = "/v2/reference/news"
+
+# Field accessors for Polygon.io bars, mapped over a series (C-level lookups, no per-bar Python frame)
+_bar_timestamp = itemgetter('t')
+_bar_volume = itemgetter('v')
+_bar_close = itemgetter('c')
+
+# Punctuation dropped and separators dashed when formatting company names, then share-class suffixes stripped
+_NAME_TRANSLATION = str.maketrans({'.': None, ',': None, ' ': '-'})
+_NAME_SUFFIX_RE = re.compile(r'-(?:common-stock|class-[ab])')
+
+
+# Investing.com pages for symbols whose URL can't be derived from the company name;
+# everything else links to an Investing.com search
+INVESTING_URLS = {
+    'VERA': 'https://www.investing.com/equities/vera-therapeutics',
+    'ANIX': 'https://www.investing.com/equities/copytele-inc',
+    'INMB': 'https://www.investing.com/equities/inmune-bio',
+    'GUTS': 'https://www.investing.com/equities/fractyl-health-consensus-estimates',
+    'MIRA': 'https://www.investing.com/equities/mira-pharmaceuticals',
+    'EYPT': 'https://uk.investing.com/equities/psivida-corp',
+    'GNPX': 'https://www.investing.com/equities/genprex',
+    'GLUE': 'https://www.investing.com/equities/monte-rosa-therapeutics',
+    'TGTX': 'https://www.investing.com/equities/tg-therapeutics-inc',
+    'AUPH': 'https://www.investing.com/equities/aurinia-pharmace',
+    'ITCI': 'https://in.investing.com/equities/intracellular-th',
+    'CLOV': 'https://www.investing.com/equities/social-capital-hedosophia-hold-iii',
+    'CERE': 'https://www.investing.com/equities/arya-sciences-acquisition-ii',
+    'IPHA': 'https://www.investing.com/equities/innate-pharma-news?cid=1153095',
+    'MDWD': 'https://www.investing.com/equities/mediwound-l',
+    'ZYME': 'https://www.investing.com/equities/zymeworks-inc',
+    'ASMB': 'https://www.investing.com/equities/ventrus-bioscienc',
+    'JAZZ': 'https://www.investing.com/equities/jazz-pharmaceuticals',
+    'PRTA': 'https://www.investing.com/equities/prothena-corp',
+    'TMDX': 'https://www.investing.com/equities/transmedics-group-inc',
+    'GILD': 'https://www.investing.com/equities/gilead-sciences-inc',
+    'NTNX': 'https://www.investing.com/equities/nutanix-inc',
+    'INAB': 'https://www.investing.com/equities/in8bio-inc',
+    'MNPR': 'https://ph.investing.com/equities/monopar-therapeutics-inc',
+    'APVO': 'https://www.investing.com/equities/aptevo-therapeutics-inc',
+    'HRMY': 'https://www.investing.com/equities/harmony-biosciences-holdings',
+    'BHC': 'https://www.investing.com/equities/valeant-pharma',
+    'BCRX': 'https://www.investing.com/equities/biocryst-pharmaceuticals',
+    'GRTX': 'https://www.investing.com/equities/galera-therapeutics-inc',
+    'AXSM': 'https://www.investing.com/equities/axsome-therapeutics-inc',
+    'SMMT': 'https://www.investing.com/equities/summit-therapeutics-plc',
+    'SAGE': 'https://www.investing.com/equities/sage-therapeutic',
+    'MYNZ': 'https://www.investing.com/equities/mainz-biomed-bv',
+    'GMAB': 'https://www.investing.com/equities/genmab',
+    'LUMO': 'https://uk.investing.com/equities/newlink-genetics-news/7',
+    'NEO': 'https://www.investing.com/equities/neo-energy-metals-consensus-estimates',
+    'ARCT': 'https://www.investing.com/equities/alcobra-ltd',
+    'TEVA': 'https://www.investing.com/equities/teva-pharmaceutical-inds-ltd',
+    'VMD': 'https://ca.investing.com/equities/viemed-healthcare',
+    'VERU': 'https://www.investing.com/equities/female-health-com',
+    'VRCA': 'https://in.investing.com/equities/verrica-pharmaceuticals',
+    'SIGA': 'https://www.investing.com/equities/siga-technologies',
+    'INMD': 'https://www.investing.com/equities/inmode-ltd',
+    'EXEL': 'https://www.investing.com/equities/exelixis-inc',
+    'CPRX': 'https://www.investing.com/equities/catalyst-pharmaceuticals',
+    'HALO': 'https://www.investing.com/equities/halo-technologies-holdings-scoreboard',
+    'NVOS': 'https://www.investing.com/equities/turbine-truck-engine',
+    'ATAI': 'https://www.investing.com/equities/atai-life-sciences-bv',
+    'BNGO': 'https://www.investing.com/equities/bionano-genomics',
+    'ENOV': 'https://in.investing.com/equities/colfax',
+    'BIIB': 'https://www.investing.com/equities/biogen-idec-inc',
+    'MIST': 'https://www.investing.com/equities/milestone-pharmaceuticals-inc',
+    'ARDX': 'https://www.investing.com/equities/ardelyx-inc',
+    'CVM': 'https://www.investing.com/equities/cel-sci-corp',
+    'ACLS': 'https://www.investing.com/equities/axcelis-tech',
+    'IDYA': 'https://www.investing.com/equities/ideaya-biosciences-inc',
+    'RYTM': 'https://www.investing.com/equities/rhythm-pharma',
+    'TWST': 'https://www.investing.com/equities/twist-bioscience-corporation',
+    'STEM': 'https://www.investing.com/equities/star-peak-energy-transition',
+    'GERN': 'https://www.investing.com/equities/geron-corp',
+    'VIR': 'https://www.investing.com/equities/vir-biotechnology-inc',
+    'ALKS': 'https://www.investing.com/equities/alkermes-plc',
+    'AMPH': 'https://www.investing.com/equities/amphastar-p',
+    'SVRA': 'https://uk.investing.com/equities/mast-therapeutics',
+    'EVLO': 'https://www.investing.com/equities/evelo-biosciences',
+    'GH': 'https://www.investing.com/equities/gh-research',
+    'NTLA': 'https://www.investing.com/equities/intellia-therapeutics-inc',
+    'MRTX': 'https://www.investing.com/equities/mirati-ther',
+    'SRPT': 'https://www.investing.com/equities/sarepta',
+    'RARE': 'https://www.investing.com/equities/ultragenyx',
+    'TRVI': 'https://www.investing.com/equities/trevi-therapeutics-inc',
+    'PGEN': 'https://www.investing.com/equities/intrexon-corpn',
+    'EVH': 'https://www.investing.com/equities/evolent-health-inc',
+    'ARQT': 'https://www.investing.com/equities/arcutis-biotherapeutics-inc',
+    'QNRX': 'https://www.investing.com/equities/cellect-biotechnology-adr',
+    'SYRS': 'https://www.investing.com/equities/syros-pharmaceuticals-inc',
+    'GTHX': 'https://www.investing.com/equities/g1-therapeutics-inc',
+    'MNKD': 'https://www.investing.com/equities/mannkind-corp',
+    'XERS': 'https://www.investing.com/equities/xeris-pharmaceuticals',
+    'SNDX': 'https://www.investing.com/equities/syndax-pharmaceuticals-consensus-estimates',
+    'PRTK': 'https://www.investing.com/equities/transcept-pharmaceuticals',
+    'PLRX': 'https://www.investing.com/equities/pliant-therapeutics-inc',
+    'MREO': 'https://www.investing.com/equities/mereo-biopharma-group',
+    'MDGL': 'https://uk.investing.com/equities/synta-pharmaceuticals-historical-data',
+    'KZR': 'https://uk.investing.com/equities/kalamazoo-resources-ltd',
+    'GALT': 'https://www.investing.com/equities/galectin-therapeutics-inc.',
+    'ETNB': 'https://www.investing.com/equities/89bio-inc',
+    'EPZM': 'https://www.investing.com/equities/epizyme-inc',
+    'CMRX': 'https://www.investing.com/equities/chimerix-inc',
+    'CDTX': 'https://www.investing.com/equities/cidara-therapeutics-inc',
+    'GYRE': 'https://www.investing.com/equities/targacept',
+    'CBAY': 'https://www.investing.com/equities/cymabay-therapeu',
+    'AGEN': 'https://www.investing.com/equities/agenus-inc',
+    'ABUS': 'https://www.investing.com/equities/tekmira-pharmaceuticals-corp',
+    'ABCL': 'https://www.investing.com/equities/abcellera-biologics',
+    'LOGC': 'https://www.investing.com/equities/logicbio-therapeutics',
+    'BLCM': 'https://www.investing.com/equities/bellicum-pharmaceuticals-inc-consensus-estimates',
+    'ADVM': 'https://www.investing.com/equities/avalanche-biotec',
+    'SNY': 'https://www.investing.com/equities/sanofi',
+    'MRSN': 'https://www.investing.com/equities/mersana-therapeutics-inc',
+    'TCRT': 'https://www.investing.com/equities/ziopharm-oncology',
+    'ASRT': 'https://www.investing.com/equities/depomed',
+    'ABBV': 'https://www.investing.com/equities/abbvie-inc',
+    'ADMA': 'https://www.investing.com/equities/adma-biologics-inc',
+    'RKLB': 'https://www.investing.com/equities/vector-acquisition'
+}
+
+# Placeholder results returned when a lookup has nothing to report. They are shared, so callers
+# must treat them as read-only (records are only ever serialized, never mutated).
+EMPTY_INSIDER_SUMMARY: InsiderSummary = {
+    "recent_trades": 0,
+    "net_shares": 0,
+    "notable_trades": [],
+    "summary": {
+        "total_sales": 0,
+        "total_purchases": 0,
+        "total_awards": 0,
+        "sales_count": 0,
+        "purchases_count": 0,
+        "awards_count": 0,
+        "total_value": {
+            "sales": 0,
+            "purchases": 0,
+            "awards": 0
+        }
+    },
+    "latest_date": None
+}
+
+EMPTY_FINANCIAL_METRICS: FinancialMetrics = {
+    "peRatios": {"trailingPE": None, "forwardPE": None},
+    "estimates": {
+        "revenue": {"nextQuarter": None, "currentYear": None, "nextYear": None},
+        "earnings": {"nextQuarter": None, "currentYear": None, "nextYear": None}
+    },
+    "quarterly": {
+        "revenue": [],
+        "revenueChange": [],
+        "periods": []
+    }
+}
+
+EMPTY_DETAILED_FINANCIALS: DetailedFinancials = {
+    "revenue": [],
+    "revenueChanges": [],
+    "netIncome": [],
+    "netIncomeChanges": [],
+    "operatingMargin": [],
+    "operatingMarginChanges": [],
+    "freeCashFlow": [],
+    "freeCashFlowChanges": [],
+    "dates": []
+}
+
+EMPTY_VOLUME_METRICS: VolumeMetrics = {
+    'current_volume': 0,
+    'prev_volume': 0,
+    'sma': None,
+    'recent_volumes': [],
+    'volume_dates': [],
+    'daily_changes': [],
+    'current_ratio': None,
+    'volume_24h_change': 0,
+    'volume_vs_avg': 0,
+    'days_included': 0
+}
+
+# Company details keyed by symbol, shared by every fetcher in this process
+COMPANY_DETAILS_TTL = 24 * 3600
+_company_details_cache: Dict[str, tuple] = {}
+_company_details_lock = threading.Lock()
+
+
+def _seconds_since_settle(now: Optional[datetime] = None) -> float:
+    """
+    Seconds since the most recent weekday session's bars settled, or 0 while a session is open.
+    Holidays count as sessions, which only makes the cache more conservative.
+    """
+    now = now or datetime.now(MARKET_TZ)
+    if now.weekday() < 5 and MARKET_OPEN <= now.time() < MARKET_SETTLE:
+        return 0
+    settle = now.replace(hour=MARKET_SETTLE.hour, minute=MARKET_SETTLE.minute, second=0, microsecond=0)
+    if settle > now:
+        settle -= timedelta(days=1)
+    while settle.weekday() >= 5:
+        settle -= timedelta(days=1)
+    return (now - settle).total_seconds()
+
+
+def _bar_dates(bars: List[Dict]) -> List[str]:
+    """YYYY-MM-DD for each Polygon.io bar, formatted in one pass from the millisecond timestamps"""
+    timestamps = np.fromiter(map(_bar_timestamp, bars), dtype=np.int64, count=len(bars))
+    return np.datetime_as_string(timestamps.astype('datetime64[ms]'), unit='D').tolist()
+
+
+def _pct_changes(values: np.ndarray) -> List[float]:
+    """Day-over-day percentage changes rounded to 2 places (0.0 where the previous value is not positive)"""
+    prev = values[:-1]
+    valid = prev > 0
+    changes = np.zeros(len(prev))
+    changes[valid] = (values[1:][valid] - prev[valid]) / prev[valid] * 100
+    return np.round(changes, 2).tolist()
+
+
+def _settled_ttl(ttl: int) -> float:
+    """ttl, stretched while the market is closed so anything fetched after the last settle stays fresh until the next open"""
+    return max(ttl, _seconds_since_settle())
+
+
+@lru_cache(maxsize=1024)
+def _yf_ticker(symbol: str) -> yf.Ticker:
+    """
+    Shared yfinance Ticker per symbol so its lazily loaded info and
+    statements are fetched from Yahoo once per collection run
+    """
+    return yf.Ticker(symbol)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills at `rate` tokens per second up to `capacity`
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    def acquire(self):
+        """Take one token, sleeping exactly until one is available"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def drain(self, delay: float = 0):
+        """Empty the bucket, e.g. after the server reports a rate limit, holding callers off for delay seconds"""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0, -delay * self.rate)
+
+class MarketDataWriter:
+    """
+    Streams records into a JSON array beside the target file and moves it into place on commit,
+    so readers only ever see a complete market_data.json
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self.partial_path = path.with_name(f"{path.stem}.collecting{path.suffix}")
+        self.count = 0
+        self._file = self.partial_path.open('wb')
+        self._file.write(b'[\n')
+
+    @staticmethod
+    def load_partial(path: Path) -> Dict[str, Dict]:
+        """
+        Records left in the partial file by an interrupted run, keyed by symbol.
+        Only records collected today are returned.
+        """
+        partial_path = path.with_name(f"{path.stem}.collecting{path.suffix}")
+        try:
+            content = partial_path.read_bytes().rstrip().rstrip(b',')
+            if not content.endswith(b']'):
+                content += b'\n]'
+            records = orjson.loads(content)
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        return {
+            record['symbol']: record
+            for record in records
+            if isinstance(record, dict) and 'symbol' in record and str(record.get('timestamp', '')).startswith(today)
+        }
+
+    def write(self, record: Dict):
+        """Append one record and flush it, so a crash keeps everything written so far"""
+        if self.count:
+            self._file.write(b',\n')
+        self._file.write(orjson.dumps(record, option=MARKET_DATA_JSON_OPTIONS))
+        self._file.flush()
+        self.count += 1
+
+    def commit(self):
+        """Close the array and atomically replace the target file"""
+        self._file.write(b'\n]\n')
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+
+    def abort(self, discard: bool = False):
+        """Stop writing, leaving the partial file in place unless discard is set"""
+        self._file.close()
+        if discard:
+            self.partial_path.unlink(missing_ok=True)
+
 class HybridDataFetcher:
     def __init__(self, polygon_key: str):
         self.polygon_key = polygon_key
         self.base_url = "https://api.polygon.io"
+        self.session = self._create_session()
+        self.rate_limiter = TokenBucket(POLYGON_RATE, POLYGON_BURST)
+        self.inflight = threading.BoundedSemaphore(POLYGON_MAX_INFLIGHT)
+        # 52-week ranges prefetched for the current run, keyed by symbol
+        self._yf_info_cache: Dict[str, Dict] = {}
+        self.cache = FileCache(get_project_root() / '.cache')
+        self._memo = OrderedDict()
+        self._memo_lock = threading.Lock()
+        # Reference time for lookback windows; one value per run so every symbol uses the same cutoffs
+        self.scan_time = datetime.now()
+        # (start, end) date strings for each daily-bar lookback, formatted once per run from scan_time
+        self._aggs_ranges: Dict[int, Tuple[str, str]] = {}
+        # Shared pool for a symbol's independent API calls; the rate limiter still paces Polygon.io
+        self.request_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS * REQUEST_FANOUT, thread_name_prefix='fetch')
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled session so every Polygon.io call reuses the same connections
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False
+        )
+        # Every call goes to one host, so a single pool sized to the in-flight cap keeps all connections alive
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POLYGON_MAX_INFLIGHT, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        # Sent with every request; the session only ever talks to Polygon.io
+        session.params = {'apiKey': self.polygon_key}
+        return session
         
-    @sleep_and_retry
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
+    def _cache_ttl(self, endpoint: str) -> int:
+        """Return the cache TTL for an endpoint, or 0 if it shouldn't be cached"""
+        for prefix, ttl in POLYGON_CACHE_TTLS:
+            if endpoint.startswith(prefix):
+                if prefix == AGGS_PREFIX:
+                    # Reruns before the next open stay offline
+                    return _settled_ttl(ttl)
+                return ttl
+        return 0
+
+    def _remember(self, key: str, data: Dict):
+        """Store a response in the in-process memo, evicting the least recently used entry"""
+        with self._memo_lock:
+            self._memo[key] = data
+            self._memo.move_to_end(key)
+            if len(self._memo) > MEMO_MAX_ENTRIES:
+                self._memo.popitem(last=False)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """Seconds the server asked us to wait before retrying"""
+        try:
+            return max(float(response.headers.get('Retry-After', DEFAULT_RETRY_AFTER)), 0)
+        except ValueError:
+            return DEFAULT_RETRY_AFTER
+
+    def _make_request(self, endpoint: str, params: Dict = None, retry_on_limit: bool = True) -> Dict:
         """
         Make rate-limited API request to Polygon.io
         """
         if params is None:
             params = {}
-            
-        # Add API key to parameters
-        params['apiKey'] = self.polygon_key
         
+        cache_key = FileCache.make_key(endpoint, params)
+        
+        # Identical requests within a run are answered from memory
+        with self._memo_lock:
+            if cache_key in self._memo:
+                self._memo.move_to_end(cache_key)
+                return self._memo[cache_key]
+        
+        ttl = self._cache_ttl(endpoint)
+        if ttl:
+            cached = self.cache.get(cache_key, ttl)
+            if cached is not None:
+                self._remember(cache_key, cached)
+                return cached
+        
+        self.rate_limiter.acquire()
         try:
-            response = requests.get(f"{self.base_url}{endpoint}", params=params)
+            with self.inflight:
+                response = self.session.get(f"{self.base_url}{endpoint}", params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            data = orjson.loads(response.content)
+            self._remember(cache_key, data)
+            if ttl:
+                self.cache.set(cache_key, data)
+            return data
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 429 and retry_on_limit:
+                retry_after = self._retry_after(e.response)
+                logger.warning(f"Rate limit hit, pausing requests for {retry_after:.0f}s")
+                self.rate_limiter.drain(retry_after)
+                return self._make_request(endpoint, params, retry_on_limit=False)
+            logger.error(f"API request failed: {str(e)}")
+            return None
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"API request failed: {str(e)}")
-            if response.status_code == 429:
-                logger.warning("Rate limit hit, sleeping for 60 seconds...")
-                time.sleep(60)
             return None
         
-    def get_detailed_financials(self, symbol: str) -> Dict[str, Any]:
-        try:
-            ticker = yf.Ticker(symbol)
-            
-            # # Get statements and log what we receive
-            # income_stmt = ticker.income_stmt
-            # cashflow = ticker.cashflow
-            
-            # # Convert to DataFrame if not already
-            # quarterly_income = pd.DataFrame(income_stmt)
-            # quarterly_cashflow = pd.DataFrame(cashflow)
-            
-            financials = {
-                "revenue": [],
-                "revenueChanges": [],
-                "netIncome": [],
-                "netIncomeChanges": [],
-                "operatingMargin": [],  # Change from gross margin to operating margin
-                "operatingMarginChanges": [],
-                "freeCashFlow": [],
-                "freeCashFlowChanges": [],
-                "dates": []
-            }
-            
-            return financials
-            
-        except Exception as e:
-            logger.error(f"Error fetching detailed financials for {symbol}: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())  # Add stack trace for debugging
-            return {
-                "revenue": [],
-                "revenueChanges": [],
-                "netIncome": [],
-                "netIncomeChanges": [],
-                "operatingMargin": [],
-                "operatingMarginChanges": [],
-                "freeCashFlow": [],
-                "freeCashFlowChanges": [],
-                "dates": []
-            }
-    def get_financials_metrics(self, symbol: str) -> Dict[str, Any]:
+    def get_yf_info(self, symbol: str) -> Dict[str, Any]:
+        """
+        yfinance info for a symbol, served from the file cache for YF_INFO_CACHE_TTL seconds
+        during a session and from the last settle until the next open otherwise
+        """
+        cache_key = f"yfinance_info:{symbol}"
+        cached = self.cache.get(cache_key, _settled_ttl(YF_INFO_CACHE_TTL))
+        if cached is not None:
+            return cached
+        
+        info = _yf_ticker(symbol).info
+        if info:
+            self.cache.set(cache_key, info)
+        return info
+
+    def get_detailed_financials(self, symbol: str) -> DetailedFinancials:
+        return EMPTY_DETAILED_FINANCIALS
+
+    def get_financials_metrics(self, symbol: str) -> FinancialMetrics:
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            income_stmt = ticker.income_stmt  # Use this instead of quarterly_earnings
-            
+            info = self.get_yf_info(symbol)
             
-            # Get PE Ratios
+            # Get PE Ratios (precomputed by Yahoo, no trailing EPS accumulation needed)
             pe_ratios = {
                 "trailingPE": info.get('trailingPE'),
                 "forwardPE": info.get('forwardPE'),
@@ -150,31 +599,13 @@ class HybridDataFetcher:
                 }
             }
             
-            # # Get quarterly data
-            # quarterly_revenue = pd.DataFrame(ticker.quarterly_earnings)
-            # quarterly_balance = pd.DataFrame(ticker.quarterly_balance_sheet)
-            # quarterly_cashflow = pd.DataFrame(ticker.quarterly_cashflow)
-            
-            # Process quarterly data
+            # Quarterly statements aren't fetched, so these series stay empty
             quarterly_metrics = {
                 "revenue": [],
                 "revenueChange": [],
                 "periods": []
             }
             
-            # if not quarterly_revenue.empty:
-            #     for date, row in quarterly_revenue.iterrows():
-            #         quarterly_metrics["periods"].append(date.strftime('%Y-%m-%d'))
-            #         quarterly_metrics["revenue"].append(float(row['Revenue']))
-            #         # Calculate YoY change
-            #         prev_year = date - pd.DateOffset(years=1)
-            #         if prev_year in quarterly_revenue.index:
-            #             change = ((row['Revenue'] - quarterly_revenue.loc[prev_year, 'Revenue']) / 
-            #                     quarterly_revenue.loc[prev_year, 'Revenue'] * 100)
-            #             quarterly_metrics["revenueChange"].append(round(change, 2))
-            #         else:
-            #             quarterly_metrics["revenueChange"].append(None)
-            
             metrics = {
                 "peRatios": pe_ratios,
                 "estimates": estimates,
@@ -185,128 +616,111 @@ class HybridDataFetcher:
             
         except Exception as e:
             logger.error(f"Error fetching financial metrics for {symbol}: {str(e)}")
-            return {
-                "peRatios": {"trailingPE": None, "forwardPE": None},
-                "estimates": {
-                    "revenue": {"nextQuarter": None, "currentYear": None, "nextYear": None},
-                    "earnings": {"nextQuarter": None, "currentYear": None, "nextYear": None}
-                },
-                "quarterly": {
-                    "revenue": [],
-                    "revenueChange": [],
-                    "periods": []
-                }
-            }
+            return EMPTY_FINANCIAL_METRICS
 
-    def get_insider_data(self, symbol: str, months_lookback: int = 3) -> Dict[str, Any]:
+    def get_insider_data(self, symbol: str, months_lookback: int = 3) -> InsiderSummary:
         """
-        Get enhanced insider trading data from yfinance with fixed transaction categorization
+        Get insider trading summary, served from the file cache when fresh
+        """
+        cache_key = f"insider:{symbol}:{months_lookback}"
+        cached = self.cache.get(cache_key, INSIDER_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        insider_data = self._fetch_insider_data(symbol, months_lookback)
+        if insider_data is None:
+            return EMPTY_INSIDER_SUMMARY
+        
+        self.cache.set(cache_key, insider_data)
+        return insider_data
+
+    def _fetch_insider_data(self, symbol: str, months_lookback: int = 3) -> Optional[InsiderSummary]:
+        """
+        Get enhanced insider trading data from yfinance with fixed transaction categorization.
+        Returns None if the data could not be fetched.
         """
         try:
             logger.info(f"Fetching insider data for {symbol} from yfinance")
-            ticker = yf.Ticker(symbol)
+            ticker = _yf_ticker(symbol)
             transactions = ticker.insider_transactions
             
             if transactions is None or transactions.empty:
-                return {
-                    "recent_trades": 0,
-                    "net_shares": 0,
-                    "notable_trades": [],
-                    "summary": {
-                        "total_sales": 0,
-                        "total_purchases": 0,
-                        "total_awards": 0,
-                        "sales_count": 0,
-                        "purchases_count": 0,
-                        "awards_count": 0
-                    }
-                }
+                return EMPTY_INSIDER_SUMMARY
             
-            # Convert dates and ensure numeric values
-            transactions['Start Date'] = pd.to_datetime(transactions['Start Date'])
-            transactions['Value'] = pd.to_numeric(transactions['Value'], errors='coerce')
-            transactions['Shares'] = pd.to_numeric(transactions['Shares'], errors='coerce')
+            # Filter for recent transactions with a raw datetime64 comparison (unparseable dates drop out)
+            start_dates = transactions['Start Date']
+            if not pd.api.types.is_datetime64_dtype(start_dates):
+                # yfinance usually returns parsed dates already; only string columns need the parse
+                start_dates = pd.to_datetime(start_dates, errors='coerce', cache=True)
+            start_dates = start_dates.to_numpy(dtype='datetime64[ns]')
+            cutoff_date = np.datetime64(self.scan_time - timedelta(days=30 * months_lookback), 'ns')
+            mask = start_dates >= cutoff_date
+            recent_transactions = transactions.loc[mask].copy()
             
-            # Filter for recent transactions
-            cutoff_date = datetime.now() - timedelta(days=30 * months_lookback)
-            recent_transactions = transactions[transactions['Start Date'] >= cutoff_date].copy()
+            # Convert dates and ensure numeric values on the recent rows only
+            recent_transactions['Start Date'] = start_dates[mask]
+            recent_transactions['Value'] = pd.to_numeric(recent_transactions['Value'], errors='coerce')
+            recent_transactions['Shares'] = pd.to_numeric(recent_transactions['Shares'], errors='coerce')
             
             if recent_transactions.empty:
-                return {
-                    "recent_trades": 0,
-                    "net_shares": 0,
-                    "notable_trades": [],
-                    "summary": {
-                        "total_sales": 0,
-                        "total_purchases": 0,
-                        "total_awards": 0,
-                        "sales_count": 0,
-                        "purchases_count": 0,
-                        "awards_count": 0
-                    }
-                }
+                return EMPTY_INSIDER_SUMMARY
             
-            # Categorize transactions based on price per share and value
-            def categorize_transaction(row):
-                if pd.isna(row['Transaction']) or row['Transaction'] == '':
-                    # If transaction type is empty, categorize based on price and value
-                    if row['Value'] > 0:
-                        price_per_share = row['Value'] / row['Shares']
-                        if price_per_share < 20:  # Threshold for identifying awards/grants
-                            return 'Stock Award'
-                        else:
-                            return 'Sale'  # High value per share typically indicates a sale
-                return row['Transaction']
-            
-            recent_transactions['Transaction_Category'] = recent_transactions.apply(categorize_transaction, axis=1)
+            # Categorize transactions missing a type based on price per share and value
+            transaction = recent_transactions['Transaction']
+            value = recent_transactions['Value']
+            price_per_share = value / recent_transactions['Shares']
+            inferred = (transaction.isna() | (transaction == '')) & (value > 0)
+            is_award = inferred & (price_per_share < 20)  # Threshold for identifying awards/grants
+            is_sale = inferred & ~(price_per_share < 20)  # High value per share typically indicates a sale
+            recent_transactions['Transaction_Category'] = np.select(
+                [is_award, is_sale],
+                ['Stock Award', 'Sale'],
+                default=transaction.to_numpy(dtype=object)
+            )
             
-            # Categorize based on the enhanced transaction type
-            sales = recent_transactions[recent_transactions['Transaction_Category'] == 'Sale']
-            awards = recent_transactions[recent_transactions['Transaction_Category'] == 'Stock Award']
-            purchases = recent_transactions[
-                ~recent_transactions.index.isin(sales.index) & 
-                ~recent_transactions.index.isin(awards.index)
-            ]
+            # Bucket by the enhanced transaction type; anything that isn't a sale or award is a purchase.
+            # Every total is a masked reduction over the same float64 arrays (NaN values count as 0).
+            category = recent_transactions['Transaction_Category'].to_numpy()
+            share_amounts = recent_transactions['Shares'].to_numpy(dtype=np.float64)
+            trade_values = recent_transactions['Value'].to_numpy(dtype=np.float64)
+            sale_rows = category == 'Sale'
+            award_rows = category == 'Stock Award'
+            buckets = {'sales': sale_rows, 'purchases': ~(sale_rows | award_rows), 'awards': award_rows}
+            shares = {name: np.nansum(share_amounts[rows]) for name, rows in buckets.items()}
+            values = {name: np.nansum(trade_values[rows]) for name, rows in buckets.items()}
+            counts = {name: np.count_nonzero(rows) for name, rows in buckets.items()}
             
             # Calculate net shares (sales are negative, awards and purchases are positive)
-            net_shares = (
-                purchases['Shares'].sum() + 
-                awards['Shares'].sum() - 
-                sales['Shares'].sum()
-            )
+            net_shares = shares['purchases'] + shares['awards'] - shares['sales']
             
-            # Format notable trades (any transaction over $100,000)
-            notable_trades = []
-            significant_transactions = recent_transactions[recent_transactions['Value'] >= 100000]
+            # Format notable trades (the most recent transactions over $100,000)
+            significant_transactions = recent_transactions[recent_transactions['Value'] >= 100000].nlargest(MAX_NOTABLE_TRADES, 'Start Date')
+            trade_value = significant_transactions['Value']
+            trade_shares = significant_transactions['Shares']
+            notable_frame = pd.DataFrame({
+                "date": significant_transactions['Start Date'].dt.strftime('%Y-%m-%d'),
+                "insider": significant_transactions['Insider'],
+                "position": significant_transactions['Position'],
+                "type": significant_transactions['Transaction_Category'],
+                "shares": trade_shares.fillna(0).astype('int64'),
+                "value": trade_value.astype('float64'),
+                "price_per_share": (trade_value / trade_shares).where((trade_value > 0) & (trade_shares != 0), 0.0).astype('float64')
+            })
             
-            for _, trade in significant_transactions.iterrows():
-                price_per_share = float(trade['Value'] / trade['Shares']) if trade['Value'] > 0 and trade['Shares'] != 0 else 0.0
-                transaction_type = trade['Transaction_Category']
-                
-                notable_trades.append({
-                    "date": trade['Start Date'].strftime('%Y-%m-%d'),
-                    "insider": trade['Insider'],
-                    "position": trade['Position'],
-                    "type": transaction_type,
-                    "shares": int(trade['Shares']),
-                    "value": float(trade['Value']),
-                    "price_per_share": price_per_share
-                })
-            
-            # Sort notable trades by date (most recent first)
-            notable_trades.sort(key=lambda x: x['date'], reverse=True)
+            # nlargest already ordered the trades by date (most recent first)
+            notable_trades = notable_frame.to_dict(orient='records')
             
             summary = {
-                "total_sales": int(abs(sales['Shares'].sum()) if not sales.empty else 0),
-                "total_purchases": int(purchases['Shares'].sum() if not purchases.empty else 0),
-                "total_awards": int(awards['Shares'].sum() if not awards.empty else 0),
-                "sales_count": len(sales),
-                "purchases_count": len(purchases),
-                "awards_count": len(awards),
+                "total_sales": int(abs(shares['sales'])),
+                "total_purchases": int(shares['purchases']),
+                "total_awards": int(shares['awards']),
+                "sales_count": int(counts['sales']),
+                "purchases_count": int(counts['purchases']),
+                "awards_count": int(counts['awards']),
                 "total_value": {
-                    "sales": float(sales['Value'].sum() if not sales.empty else 0),
-                    "purchases": float(purchases['Value'].sum() if not purchases.empty else 0),
-                    "awards": float(awards['Value'].sum() if not awards.empty else 0)
+                    "sales": float(values['sales']),
+                    "purchases": float(values['purchases']),
+                    "awards": float(values['awards'])
                 }
             }
             
@@ -322,35 +736,11 @@ class HybridDataFetcher:
             logger.error(f"Error fetching insider data for {symbol}: {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
-            return {
-                "recent_trades": 0,
-                "net_shares": 0,
-                "notable_trades": [],
-                "summary": {
-                    "total_sales": 0,
-                    "total_purchases": 0,
-                    "total_awards": 0,
-                    "sales_count": 0,
-                    "purchases_count": 0,
-                    "awards_count": 0,
-                    "total_value": {
-                        "sales": 0,
-                        "purchases": 0,
-                        "awards": 0
-                    }
-                },
-                "latest_date": None
-            }
+            return None
             
     def get_company_name(self, ticker):
-        base_url = "https://api.polygon.io/v3/reference/tickers/"
-        api_key = self.polygon_key
-        
-        url = f"{base_url}{ticker}?apiKey={api_key}"
-        response = requests.get(url)
-        
-        if response.status_code == 200:
-            data = response.json()
+        data = self.get_ticker_details(ticker)
+        if data and 'results' in data:
             name = data['results']['name']
             formatted_name = self.format_company_name(name)
             return formatted_name
@@ -361,150 +751,28 @@ class HybridDataFetcher:
         Convert company name to lowercase, dash-separated format.
         Example: 'ADMA Biologics, Inc.' -> 'adma-biologics-inc'
         """
-        # Remove periods and commas
-        name = name.replace('.', '').replace(',', '')
-        
-        
-        
-        # Convert to lowercase and replace spaces with dashes
-        name = name.lower().replace(' ', '-')
-        name = name.replace('-common-stock', '').replace('-class-a', '').replace('-class-b', '')
-        print(name)
-        
-        return name
+        # Drop periods and commas and turn spaces into dashes in one pass, then strip share-class suffixes
+        return _NAME_SUFFIX_RE.sub('', name.lower().translate(_NAME_TRANSLATION))
 
-            
     def get_investing_url(self, symbol: str, polygon_name: str = None, yf_name: str = None) -> str:
         """
-        Generate Investing.com URL using Polygon.io name as primary source
+        Investing.com URL for a symbol: its known page if mapped, otherwise a search for the symbol
         """
-        
-        common_mappings = {
-            'VERA': 'https://www.investing.com/equities/vera-therapeutics',
-            'ANIX': 'https://www.investing.com/equities/copytele-inc',
-            'INMB': 'https://www.investing.com/equities/inmune-bio',
-            'GUTS': 'https://www.investing.com/equities/fractyl-health-consensus-estimates',
-            'MIRA': 'https://www.investing.com/equities/mira-pharmaceuticals',
-            'EYPT': 'https://uk.investing.com/equities/psivida-corp',
-            'GNPX': 'https://www.investing.com/equities/genprex',
-            'GLUE': 'https://www.investing.com/equities/monte-rosa-therapeutics',
-            'TGTX': 'https://www.investing.com/equities/tg-therapeutics-inc',
-            'AUPH': 'https://www.investing.com/equities/aurinia-pharmace',
-            'ITCI': 'https://in.investing.com/equities/intracellular-th',
-            'CLOV': 'https://www.investing.com/equities/social-capital-hedosophia-hold-iii',
-            'CERE': 'https://www.investing.com/equities/arya-sciences-acquisition-ii',
-            'IPHA': 'https://www.investing.com/equities/innate-pharma-news?cid=1153095',
-            'MDWD': 'https://www.investing.com/equities/mediwound-l',
-            'ZYME': 'https://www.investing.com/equities/zymeworks-inc',
-            'ASMB': 'https://www.investing.com/equities/ventrus-bioscienc',
-            'JAZZ': 'https://www.investing.com/equities/jazz-pharmaceuticals',
-            'PRTA': 'https://www.investing.com/equities/prothena-corp',
-            'TMDX': 'https://www.investing.com/equities/transmedics-group-inc',
-            'GILD': 'https://www.investing.com/equities/gilead-sciences-inc',
-            'NTNX': 'https://www.investing.com/equities/nutanix-inc',
-            'INAB': 'https://www.investing.com/equities/in8bio-inc',
-            'MNPR': 'https://ph.investing.com/equities/monopar-therapeutics-inc',
-            'APVO': 'https://www.investing.com/equities/aptevo-therapeutics-inc',
-            'HRMY': 'https://www.investing.com/equities/harmony-biosciences-holdings',
-            'BHC': 'https://www.investing.com/equities/valeant-pharma',
-            'BCRX': 'https://www.investing.com/equities/biocryst-pharmaceuticals',
-            'GRTX': 'https://www.investing.com/equities/galera-therapeutics-inc',
-            'AXSM': 'https://www.investing.com/equities/axsome-therapeutics-inc',
-            'SMMT': 'https://www.investing.com/equities/summit-therapeutics-plc',
-            'SAGE': 'https://www.investing.com/equities/sage-therapeutic',
-            'MYNZ': 'https://www.investing.com/equities/mainz-biomed-bv',
-            'GMAB': 'https://www.investing.com/equities/genmab',
-            'LUMO': 'https://uk.investing.com/equities/newlink-genetics-news/7',
-            'NEO': 'https://www.investing.com/equities/neo-energy-metals-consensus-estimates',
-            'ARCT': 'https://www.investing.com/equities/alcobra-ltd',
-            'TEVA': 'https://www.investing.com/equities/teva-pharmaceutical-inds-ltd',
-            'VMD': 'https://ca.investing.com/equities/viemed-healthcare',
-            'VERU': 'https://www.investing.com/equities/female-health-com',
-            'VRCA': 'https://in.investing.com/equities/verrica-pharmaceuticals',
-            'SIGA': 'https://www.investing.com/equities/siga-technologies',
-            'INMD': 'https://www.investing.com/equities/inmode-ltd',
-            'EXEL': 'https://www.investing.com/equities/exelixis-inc',
-            'CPRX': 'https://www.investing.com/equities/catalyst-pharmaceuticals',
-            'HALO': 'https://www.investing.com/equities/halo-technologies-holdings-scoreboard',
-            'NVOS': 'https://www.investing.com/equities/turbine-truck-engine',
-            'ATAI': 'https://www.investing.com/equities/atai-life-sciences-bv',
-            'BNGO': 'https://www.investing.com/equities/bionano-genomics',
-            'ENOV': 'https://in.investing.com/equities/colfax',
-            'BIIB': 'https://www.investing.com/equities/biogen-idec-inc',
-            'MIST': 'https://www.investing.com/equities/milestone-pharmaceuticals-inc',
-            'ARDX': 'https://www.investing.com/equities/ardelyx-inc',
-            'CVM': 'https://www.investing.com/equities/cel-sci-corp',
-            'ACLS': 'https://www.investing.com/equities/axcelis-tech',
-            'IDYA': 'https://www.investing.com/equities/ideaya-biosciences-inc',
-            'RYTM': 'https://www.investing.com/equities/rhythm-pharma',
-            'TWST': 'https://www.investing.com/equities/twist-bioscience-corporation',
-            'STEM': 'https://www.investing.com/equities/star-peak-energy-transition',
-            'GERN': 'https://www.investing.com/equities/geron-corp',
-            'VIR': 'https://www.investing.com/equities/vir-biotechnology-inc',
-            'ALKS': 'https://www.investing.com/equities/alkermes-plc',
-            'AMPH': 'https://www.investing.com/equities/amphastar-p',
-            'SVRA': 'https://uk.investing.com/equities/mast-therapeutics',
-            'EVLO': 'https://www.investing.com/equities/evelo-biosciences',
-            'GH': 'https://www.investing.com/equities/gh-research',
-            'NTLA': 'https://www.investing.com/equities/intellia-therapeutics-inc',
-            'MRTX': 'https://www.investing.com/equities/mirati-ther',
-            'SRPT': 'https://www.investing.com/equities/sarepta',
-            'RARE': 'https://www.investing.com/equities/ultragenyx',
-            'TRVI': 'https://www.investing.com/equities/trevi-therapeutics-inc',
-            'PGEN': 'https://www.investing.com/equities/intrexon-corpn',
-            'EVH': 'https://www.investing.com/equities/evolent-health-inc',
-            'ARQT': 'https://www.investing.com/equities/arcutis-biotherapeutics-inc',
-            'QNRX': 'https://www.investing.com/equities/cellect-biotechnology-adr',
-            'SYRS': 'https://www.investing.com/equities/syros-pharmaceuticals-inc',
-            'GTHX': 'https://www.investing.com/equities/g1-therapeutics-inc',
-            'MNKD': 'https://www.investing.com/equities/mannkind-corp',
-            'XERS': 'https://www.investing.com/equities/xeris-pharmaceuticals',
-            'SNDX': 'https://www.investing.com/equities/syndax-pharmaceuticals-consensus-estimates',
-            'PRTK': 'https://www.investing.com/equities/transcept-pharmaceuticals',
-            'PLRX': 'https://www.investing.com/equities/pliant-therapeutics-inc',
-            'MREO': 'https://www.investing.com/equities/mereo-biopharma-group',
-            'MDGL': 'https://uk.investing.com/equities/synta-pharmaceuticals-historical-data',
-            'KZR': 'https://uk.investing.com/equities/kalamazoo-resources-ltd',
-            'GALT': 'https://www.investing.com/equities/galectin-therapeutics-inc.',
-            'ETNB': 'https://www.investing.com/equities/89bio-inc',
-            'EPZM': 'https://www.investing.com/equities/epizyme-inc',
-            'CMRX': 'https://www.investing.com/equities/chimerix-inc',
-            'CDTX': 'https://www.investing.com/equities/cidara-therapeutics-inc',
-            'GYRE': 'https://www.investing.com/equities/targacept',
-            'CBAY': 'https://www.investing.com/equities/cymabay-therapeu',
-            'AGEN': 'https://www.investing.com/equities/agenus-inc',
-            'ABUS': 'https://www.investing.com/equities/tekmira-pharmaceuticals-corp',
-            'ABCL': 'https://www.investing.com/equities/abcellera-biologics',
-            'LOGC': 'https://www.investing.com/equities/logicbio-therapeutics',
-            'BLCM': 'https://www.investing.com/equities/bellicum-pharmaceuticals-inc-consensus-estimates',
-            'ADVM': 'https://www.investing.com/equities/avalanche-biotec',
-            'SNY': 'https://www.investing.com/equities/sanofi',
-            'MRSN': 'https://www.investing.com/equities/mersana-therapeutics-inc',
-            'TCRT': 'https://www.investing.com/equities/ziopharm-oncology',
-            'ASRT': 'https://www.investing.com/equities/depomed',
-            'ABBV': 'https://www.investing.com/equities/abbvie-inc',
-            'ADMA': 'https://www.investing.com/equities/adma-biologics-inc',
-            'RKLB': 'https://www.investing.com/equities/vector-acquisition'
-        }
-        
-        try:
-            
-            # Check if we have a direct mapping
-            if symbol in common_mappings:
-                stock_url = common_mappings[symbol]
-                return stock_url
-            else:
-                return f"https://www.investing.com/search/?q={symbol}"
-        
-        except Exception as e:
-            logger.error(f"Error generating Investing.com URL for {symbol}: {str(e)}")
-            return f"https://www.investing.com/search/?q={symbol}"
+        return INVESTING_URLS.get(symbol, f"https://www.investing.com/search/?q={symbol}")
 
-    def get_company_details(self, symbol: str) -> Dict[str, Any]:
+    def get_company_details(self, symbol: str, polygon_results: Dict = None) -> Dict[str, Any]:
         """
-        Get company details with Polygon.io name as primary source
+        Get company details with Polygon.io name as primary source.
+        Pass already-fetched ticker details as polygon_results to skip the Polygon.io request.
+        Complete results are kept in-process for COMPANY_DETAILS_TTL seconds.
         """
+        with _company_details_lock:
+            cached = _company_details_cache.get(symbol)
+        if cached and time.time() - cached[0] < COMPANY_DETAILS_TTL:
+            return cached[1]
+        
         try:
+            complete = True
             company_details = {
                 "sector": "Unknown",
                 "industry": "Unknown",
@@ -515,13 +783,16 @@ class HybridDataFetcher:
             }
             
             # Get Polygon.io data first
-            logger.info(f"Fetching data for {symbol} from Polygon.io")
+            polygon_name = None
             try:
-                endpoint = f"/v3/reference/tickers/{symbol}"
-                polygon_data = self._make_request(endpoint)
+                if polygon_results is None:
+                    logger.info(f"Fetching data for {symbol} from Polygon.io")
+                    polygon_data = self.get_ticker_details(symbol)
+                    if polygon_data and 'results' in polygon_data:
+                        polygon_results = polygon_data['results']
                 
-                if (polygon_data and 'results' in polygon_data):
-                    results = polygon_data['results']
+                if polygon_results:
+                    results = polygon_results
                     branding = results.get('branding', {})
                     
                     # Get the official name from Polygon
@@ -543,15 +814,17 @@ class HybridDataFetcher:
                         "sector": results.get('sic_sector', 'Unknown'),
                         "industry": results.get('sic_industry', 'Unknown')
                     })
+                else:
+                    complete = False
             except Exception as e:
                 logger.error(f"Error fetching Polygon.io company data: {str(e)}")
                 polygon_name = None
+                complete = False
 
             # Get additional data from yfinance
             logger.info(f"Fetching additional data for {symbol} from yfinance")
             try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
+                info = self.get_yf_info(symbol)
                 yf_name = info.get('longName')
                 
                 # Update with yfinance data only if Polygon didn't provide it
@@ -571,6 +844,7 @@ class HybridDataFetcher:
             except Exception as e:
                 logger.error(f"Error fetching yfinance company data: {str(e)}")
                 yf_name = None
+                complete = False
 
             # Generate Investing.com URL using Polygon name as primary source
             company_details["investing_url"] = self.get_investing_url(
@@ -579,6 +853,9 @@ class HybridDataFetcher:
                 yf_name=yf_name
             )
             
+            if complete:
+                with _company_details_lock:
+                    _company_details_cache[symbol] = (time.time(), company_details)
             return company_details
         
         except Exception as e:
@@ -596,160 +873,69 @@ class HybridDataFetcher:
                     "short": symbol
                 }
             }
+
+    def _daily_aggs_endpoint(self, symbol: str, days: int) -> str:
+        """Daily aggregates path covering the `days` calendar days up to the scan time"""
+        date_range = self._aggs_ranges.get(days)
+        if date_range is None:
+            start_date = self.scan_time - timedelta(days=days)
+            date_range = self._aggs_ranges[days] = (start_date.strftime('%Y-%m-%d'), self.scan_time.strftime('%Y-%m-%d'))
+        return DAILY_AGGS_PATH.format(symbol=symbol, start=date_range[0], end=date_range[1])
+
     def get_aggregates(self, symbol: str, days: int = 90) -> Dict:
         """
         Get daily aggregates from Polygon.io
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        endpoint = f"/v2/aggs/ticker/{symbol}/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-        return self._make_request(endpoint)
+        endpoint = self._daily_aggs_endpoint(symbol, days)
+        return self._make_request(endpoint, DAILY_AGGS_PARAMS)
 
     def get_ticker_details(self, symbol: str) -> Dict:
         """
         Get company details from Polygon.io
         """
-        endpoint = f"/v3/reference/tickers/{symbol}"
+        endpoint = TICKER_DETAILS_PATH.format(symbol=symbol)
         return self._make_request(endpoint)
 
-    def get_sma(self, symbol: str, window: int = 90) -> Dict:
-        """
-        Calculate SMA from Polygon.io data
-        """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=window + 10)
-        
-        endpoint = f"/v2/aggs/ticker/{symbol}/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-        data = self._make_request(endpoint)
-        
-        if not data or 'results' not in data:
-            return None
-            
-        volumes = [bar['v'] for bar in data['results']]
-        if len(volumes) < window:
-            return None
-            
-        sma = sum(volumes[-window:]) / window
-        return {'value': sma}
-
-    def get_rsi(self, symbol: str) -> Dict:
+    def get_rsi(self, bars: List[Dict]) -> Optional[Dict]:
         """
-        Calculate RSI from Polygon.io data
+        Calculate Wilder RSI over a symbol's daily bars (the DAILY_BARS_DAYS series
+        fetched once per symbol), or None when there are too few bars.
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=15)
-        
-        endpoint = f"/v2/aggs/ticker/{symbol}/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-        data = self._make_request(endpoint)
-        
-        if not data or 'results' not in data:
-            return None
-            
-        closes = [bar['c'] for bar in data['results']]
-        if len(closes) < 14:
+        closes = np.fromiter(map(_bar_close, bars), dtype=np.float64, count=len(bars))
+        if len(closes) <= RSI_PERIOD:
             return None
             
-        gains = []
-        losses = []
-        for i in range(1, len(closes)):
-            change = closes[i] - closes[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-                
-        avg_gain = sum(gains) / len(gains)
-        avg_loss = sum(losses) / len(losses)
-        
-        if avg_loss == 0:
-            rsi = 100
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            
-        return {'value': rsi}
-    def get_volume_history(self, symbol: str, days: int = 5) -> Dict:
-        """
-        Get detailed volume history from Polygon.io
-        """
-        try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days + 1)  # Add buffer day
-            
-            endpoint = f"/v2/aggs/ticker/{symbol}/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-            data = self._make_request(endpoint)
-            
-            if not data or 'results' not in data or not data['results']:
-                logger.error(f"No volume history data available for {symbol}")
-                return {
-                    'volumes': [],
-                    'dates': [],
-                    'volume_changes': []
-                }
-                
-            # Get volume history
-            volume_data = data['results']
-            volumes = [bar['v'] for bar in volume_data]
-            dates = [datetime.fromtimestamp(bar['t']/1000).strftime('%Y-%m-%d') for bar in volume_data]
-            
-            # Calculate daily volume changes
-            volume_changes = []
-            for i in range(1, len(volumes)):
-                if volumes[i-1] > 0:
-                    change = ((volumes[i] - volumes[i-1]) / volumes[i-1]) * 100
-                    volume_changes.append(round(change, 2))
-                else:
-                    volume_changes.append(0.0)
-                    
-            return {
-                'volumes': volumes,
-                'dates': dates,
-                'volume_changes': volume_changes
-            }
-        except Exception as e:
-            logger.error(f"Error getting volume history for {symbol}: {str(e)}")
-            return {
-                'volumes': [],
-                'dates': [],
-                'volume_changes': []
-            }
+        return {'value': float(rsi_wilder(closes, RSI_PERIOD)[-1])}
 
-    def get_volume_metrics(self, symbol: str) -> Dict:
+    def get_volume_metrics(self, symbol: str, bars: List[Dict] = None) -> VolumeMetrics:
         """
-        Get comprehensive volume metrics using both Polygon and yfinance data
+        Get comprehensive volume metrics using both Polygon and yfinance data.
+        Pass already-fetched daily bars (DAILY_BARS_DAYS of them) to skip the request.
         """
         try:
-            # Get recent daily volumes from Polygon (more reliable for recent data)
-            volume_history = self.get_volume_history(symbol, days=5)
-            recent_volumes = volume_history['volumes']
+            # Get 90 days of daily bars from Polygon; the recent window is a suffix of it
+            if bars is None:
+                aggs_endpoint = self._daily_aggs_endpoint(symbol, DAILY_BARS_DAYS)
+                data = self._make_request(aggs_endpoint, DAILY_AGGS_PARAMS)
+                bars = data.get('results') if data else None
             
-            if not recent_volumes:
-                logger.error(f"No recent volume data from Polygon for {symbol}")
-                return self._empty_volume_metrics()
-            
-            # Get 90-day average volume from Polygon
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=90)
-            
-            aggs_endpoint = f"/v2/aggs/ticker/{symbol}/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-            data = self._make_request(aggs_endpoint)
-            
-            if not data or 'results' not in data or not data['results']:
+            if not bars:
                 logger.error(f"No aggregate data available for {symbol}")
                 return self._empty_volume_metrics()
             
-            volumes = [bar['v'] for bar in data['results']]
+            volumes = np.fromiter(map(_bar_volume, bars), dtype=np.float64, count=len(bars))
             if len(volumes) < 5:
                 logger.error(f"Insufficient data points for {symbol}")
                 return self._empty_volume_metrics()
             
+            # Recent daily volumes (last 5 trading days), sliced once from the full series
+            recent_bars = bars[-5:]
+            recent_volumes = list(map(_bar_volume, recent_bars))
+            
             # Calculate metrics
             current_volume = recent_volumes[-1]
             prev_volume = recent_volumes[-2]
-            volume_sma = sum(volumes) / len(volumes)
+            volume_sma = float(volumes.mean())
             
             # Calculate changes
             volume_24h_change = ((current_volume - prev_volume) / prev_volume * 100) if prev_volume > 0 else 0
@@ -759,9 +945,9 @@ class HybridDataFetcher:
                 'current_volume': current_volume,
                 'prev_volume': prev_volume,
                 'sma': volume_sma,
-                'recent_volumes': recent_volumes[-5:],  # Last 5 days
-                'volume_dates': volume_history['dates'][-5:],  # Dates for the volumes
-                'daily_changes': volume_history['volume_changes'][-4:],  # Last 4 daily changes
+                'recent_volumes': recent_volumes,  # Last 5 days
+                'volume_dates': _bar_dates(recent_bars),  # Dates for the volumes
+                'daily_changes': _pct_changes(volumes[-5:]),  # Last 4 daily changes
                 'current_ratio': current_volume / volume_sma if volume_sma > 0 else None,
                 'volume_24h_change': round(volume_24h_change, 2),
                 'volume_vs_avg': round(volume_vs_avg, 2),
@@ -775,26 +961,15 @@ class HybridDataFetcher:
             logger.error(f"Error getting volume metrics for {symbol}: {str(e)}")
             return self._empty_volume_metrics()
 
-    def _empty_volume_metrics(self) -> Dict:
+    def _empty_volume_metrics(self) -> VolumeMetrics:
         """Helper method to return empty metrics structure"""
-        return {
-            'current_volume': 0,
-            'prev_volume': 0,
-            'sma': None,
-            'recent_volumes': [],
-            'volume_dates': [],
-            'daily_changes': [],
-            'current_ratio': None,
-            'volume_24h_change': 0,
-            'volume_vs_avg': 0,
-            'days_included': 0
-        }
+        return EMPTY_VOLUME_METRICS
 
     def get_news(self, symbol: str, limit: int = 5) -> Dict:
         """
         Get news from Polygon.io
         """
-        endpoint = f"/v2/reference/news"
+        endpoint = NEWS_PATH
         params = {
             'ticker': symbol,
             'limit': limit,
@@ -802,315 +977,364 @@ class HybridDataFetcher:
             'order': 'desc'
         }
         return self._make_request(endpoint, params)
-    def remove_nan_values(data):
+
+    @staticmethod
+    def summarize_news(news_data: Dict) -> List[Dict]:
         """
-        Recursively walk the data structure and replace NaN/Infinity with None.
-        Also handles NaN strings and empty strings.
+        Flatten Polygon news results into the dashboard's article summaries
         """
-        if isinstance(data, float):
-            if math.isnan(data) or math.isinf(data):
-                return None
-            return data
-        elif isinstance(data, str):
-            # Handle string "NaN" values
-            if data.lower() == "nan" or data.strip() == "":
-                return None
-            return data
-        elif isinstance(data, list):
-            return [remove_nan_values(x) for x in data]
-        elif isinstance(data, dict):
-            return {k: remove_nan_values(v) for k, v in data.items()}
-        return data
-    
-    def validate_numeric_fields(self, data):
+        return [
+            {
+                "title": article.get('title'),
+                "publisher": (article.get('publisher') or {}).get('name'),
+                "timestamp": article.get('published_utc'),
+                "url": article.get('article_url'),
+                "type": (article.get('tickers') or [None])[0]
+            }
+            for article in ((news_data or {}).get('results') or [])
+        ]
+
+    def _prefetch_52_week_ranges(self, symbols: List[str]):
         """
-        Validate and clean numeric fields in market data.
-        Returns list of any fields that had NaN values for logging.
+        Download a year of daily bars for every symbol in one batched yfinance call
+        and keep each symbol's 52-week high/low, instead of loading .info per symbol
         """
-        nan_fields = []
+        self._yf_info_cache = {}
+        if not symbols:
+            return
+        try:
+            history = yf.download(symbols, period='1y', interval='1d', auto_adjust=False, progress=False, threads=True)
+        except Exception as e:
+            logger.error(f"Error prefetching 52-week ranges: {str(e)}")
+            return
+        if history is None or history.empty:
+            return
         
-        def validate_value(value, path):
-            if isinstance(value, float):
-                if math.isnan(value) or math.isinf(value):
-                    nan_fields.append(path)
-                    return None
-            return value
-                    
-        def recursive_validate(obj, current_path=""):
-            if isinstance(obj, dict):
-                return {k: recursive_validate(v, f"{current_path}.{k}" if current_path else k) 
-                    for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [recursive_validate(item, f"{current_path}[{i}]") 
-                    for i, item in enumerate(obj)]
-            else:
-                return validate_value(obj, current_path)
-                
-        cleaned_data = recursive_validate(data)
-        return cleaned_data, nan_fields
+        highs, lows = history['High'], history['Low']
+        if isinstance(highs, pd.Series):  # Single symbol downloads come back without a ticker level
+            highs, lows = highs.to_frame(symbols[0]), lows.to_frame(symbols[0])
+        
+        for symbol, high, low in zip(highs.columns, highs.max(), lows.min()):
+            if pd.notna(high) and pd.notna(low):
+                self._yf_info_cache[symbol] = {
+                    'fiftyTwoWeekHigh': float(high),
+                    'fiftyTwoWeekLow': float(low)
+                }
+        logger.info(f"Prefetched 52-week ranges for {len(self._yf_info_cache)} of {len(symbols)} symbols")
 
-    def fetch_market_data(self, symbols: List[str]) -> List[Dict]:
+    def _fifty_two_week_range(self, symbol: str) -> Dict:
+        """52-week high/low from the batch prefetch, falling back to the ticker's info"""
+        cached = self._yf_info_cache.get(symbol)
+        if cached:
+            return cached
+        return self.get_yf_info(symbol)
+
+    def _process_symbol(self, symbol: str, run_timestamp: str = None) -> Optional[MarketRecord]:
         """
-        Fetch comprehensive market data using both Polygon.io and yfinance
+        Fetch and assemble the market data record for a single symbol.
+        run_timestamp stamps the record so every symbol in a run shares one snapshot time.
         """
-        market_data = []
+        logger.info(f"Fetching data for {symbol}")
+        
+        # Get ticker details from Polygon.io
+        details = self.get_ticker_details(symbol)
+        if not details or 'results' not in details:
+            logger.error(f"Failed to get details for {symbol}")
+            return None
+        
+        ticker_info = details['results']
+        
+        # Get enhanced company details from the same ticker details payload
+        company_details = self.get_company_details(symbol, polygon_results=ticker_info)
+        if not company_details:
+            logger.error(f"Failed to get company details for {symbol}")
+            return None
+        
+        # The remaining Polygon.io calls are independent, so overlap their round trips.
+        # One series of daily bars feeds the price change, volume metrics and RSI.
+        aggs_future = self.request_pool.submit(self.get_aggregates, symbol, DAILY_BARS_DAYS)
+        news_future = self.request_pool.submit(self.get_news, symbol)
+        
+        # yfinance is synchronous too; run its lookups alongside the Polygon.io calls
+        insider_future = self.request_pool.submit(self.get_insider_data, symbol)
+        financials_future = self.request_pool.submit(self.get_financials_metrics, symbol)
+        
+        # Get aggregates with explicit error handling
+        aggs = aggs_future.result()
+        if not aggs or 'results' not in aggs or not aggs['results']:
+            logger.error(f"Failed to get aggregates for {symbol}")
+            return None
+        
+        results = aggs['results']
+        latest = results[-1]
+        prev_day = results[-2] if len(results) > 1 else latest
+        
+        # Calculate basic metrics
+        price_change = latest['c'] - prev_day['c']
+        price_change_pct = (price_change / prev_day['c']) * 100
+        
+        # Get comprehensive volume metrics
+        logger.info(f"Getting volume metrics for {symbol}")
+        volume_metrics = self.get_volume_metrics(symbol, bars=results)
+        logger.info(f"Volume metrics for {symbol}: {volume_metrics}")
+        
+        # Get 52-week high/low from yfinance
+        try:
+            info = self._fifty_two_week_range(symbol)
+            
+            fifty_two_week_high = info.get('fiftyTwoWeekHigh')
+            fifty_two_week_low = info.get('fiftyTwoWeekLow')
+            
+            # Calculate proximity to 52-week high
+            current_price = latest['c']
+            high_proximity_pct = None
+            if fifty_two_week_high and current_price:
+                high_proximity_pct = ((fifty_two_week_high - current_price) / fifty_two_week_high) * 100
+            
+            near_high_alert = high_proximity_pct is not None and high_proximity_pct <= 5
+            
+            if fifty_two_week_high is None or fifty_two_week_low is None:
+                logger.warning(f"{symbol}: Missing 52-week data. Raw info keys: {info.keys()}")
+            
+        except Exception as e:
+            logger.error(f"Error fetching yfinance data for {symbol}: {str(e)}")
+            fifty_two_week_high = None
+            fifty_two_week_low = None
+            high_proximity_pct = None
+            near_high_alert = False
+        
+        # Get insider trades from yfinance
+        insider_summary = insider_future.result()
+        
+        # Get news from Polygon.io
+        news_data = news_future.result()
+        
+        try:
+            financial_metrics = financials_future.result()
+            detailed_financials = self.get_detailed_financials(symbol)
+        except Exception as e:
+            logger.error(f"Error getting financial metrics for {symbol}: {str(e)}")
+            financial_metrics = {}
+            detailed_financials = {}
 
         
-        for symbol in symbols:
-            try:
-                logger.info(f"Fetching data for {symbol}")
-                
-                # Get enhanced company details
-                company_details = self.get_company_details(symbol)
-                if not company_details:
-                    logger.error(f"Failed to get company details for {symbol}")
-                    continue
-                
-                # Get ticker details from Polygon.io
-                details = self.get_ticker_details(symbol)
-                if not details or 'results' not in details:
-                    logger.error(f"Failed to get details for {symbol}")
-                    continue
-                
-                ticker_info = details['results']
-                
-                # Get aggregates with explicit error handling
-                aggs = self.get_aggregates(symbol, days=5)
-                if not aggs or 'results' not in aggs or not aggs['results']:
-                    logger.error(f"Failed to get aggregates for {symbol}")
-                    continue
-                
-                results = aggs['results']
-                latest = results[-1]
-                prev_day = results[-2] if len(results) > 1 else latest
-                
-                # Calculate basic metrics
-                price_change = latest['c'] - prev_day['c']
-                price_change_pct = (price_change / prev_day['c']) * 100
-                
-                # Get volume metrics using Polygon's native SMA
-                logger.info(f"Getting volume metrics for {symbol}")
+        # Process news data
+        news_summary = self.summarize_news(news_data)
+        
+        # Get RSI data
+        rsi_data = self.get_rsi(results)
 
-                
-                            # Get comprehensive volume metrics
-                logger.info(f"Getting volume metrics for {symbol}")
-                volume_metrics = self.get_volume_metrics(symbol)
-                logger.info(f"Volume metrics for {symbol}: {volume_metrics}")
-                
-                # Get 52-week high/low from yfinance
-                try:
-                    ticker = yf.Ticker(symbol)
-                    info = ticker.info
-                    
-                    fifty_two_week_high = info.get('fiftyTwoWeekHigh')
-                    fifty_two_week_low = info.get('fiftyTwoWeekLow')
-                    
-                    # Calculate proximity to 52-week high
-                    current_price = latest['c']
-                    high_proximity_pct = None
-                    if fifty_two_week_high and current_price:
-                        high_proximity_pct = ((fifty_two_week_high - current_price) / fifty_two_week_high) * 100
-                    
-                    near_high_alert = high_proximity_pct is not None and high_proximity_pct <= 5
-                    
-                    if fifty_two_week_high is None or fifty_two_week_low is None:
-                        logger.warning(f"{symbol}: Missing 52-week data. Raw info keys: {info.keys()}")
-                    
-                except Exception as e:
-                    logger.error(f"Error fetching yfinance data for {symbol}: {str(e)}")
-                    fifty_two_week_high = None
-                    fifty_two_week_low = None
-                    high_proximity_pct = None
-                    near_high_alert = False
-                
-                # Update volume alerts based on comprehensive metrics
-                volume_alerts = {
-                    "volumeSpike10": volume_metrics['volume_24h_change'] >= 10,
-                    "volumeSpike20": volume_metrics['volume_24h_change'] >= 20,
-                    "highVolume": volume_metrics['volume_vs_avg'] > 50
+        # Evaluate each alert once; the count and the details share the results
+        price_alert = abs(price_change_pct) > 5  # 5% price movement
+        volume_24h_change = volume_metrics['volume_24h_change']
+        volume_spike_10 = volume_24h_change >= 10  # 10% volume spike
+        volume_spike_20 = volume_24h_change >= 20  # 20% volume spike
+        high_volume = volume_metrics['volume_vs_avg'] > 50
+        insider_alert = bool(insider_summary['notable_trades'])  # Insider activity
+        news_alert = bool(news_summary)  # Recent news
+        technical_alert = (rsi_data and (rsi_data['value'] > 70 or rsi_data['value'] < 30))
+        
+        alerts = price_alert + volume_spike_10 + volume_spike_20 + insider_alert + news_alert + near_high_alert
+        
+        return {
+            "symbol": symbol,
+            "timestamp": run_timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            # Enhanced company info
+                # Company names
+            "names": {
+                "long": company_details['names'].get('yfinance'),
+                "short": company_details['names'].get('short'),
+                "polygon": company_details['names'].get('polygon')
+            },
+            "sector": company_details['sector'],
+            "industry": company_details['industry'],
+            "description": company_details['description'],
+            "branding": {
+                "icon_url": company_details['icon_url'],
+                "logo_url": company_details['logo_url']
+            },
+            "investing_url": company_details['investing_url'],
+            # Price data
+            "price": latest['c'],
+            "priceChange": price_change_pct,
+            "openPrice": latest['o'],
+            "prevClose": prev_day['c'],
+            "dayHigh": latest['h'],
+            "dayLow": latest['l'],
+            # Volume data
+            "volume": volume_metrics['current_volume'],
+            "prevVolume": volume_metrics['prev_volume'],
+            "volumeMetrics": {
+                "recentVolumes": volume_metrics['recent_volumes'],
+                "volumeDates": volume_metrics['volume_dates'],
+                "dailyChanges": volume_metrics['daily_changes'],
+                "averageVolume": volume_metrics['sma'],
+                "volumeChange": volume_metrics['volume_24h_change'],
+                "volumeVsAvg": volume_metrics['volume_vs_avg']
+            },
+            # Technical indicators
+            "technicals": {
+                "rsi": rsi_data['value'] if rsi_data else None,
+                "volumeSMA": volume_metrics['sma']
+            },
+            # 52-week data
+            "fiftyTwoWeekHigh": fifty_two_week_high,
+            "fiftyTwoWeekLow": fifty_two_week_low,
+            "highProximityPct": high_proximity_pct,
+            # Market metrics
+            "marketCap": ticker_info.get('market_cap', 0),
+            # Additional data
+            "insiderActivity": insider_summary,
+            "recentNews": news_summary,
+            # Add new metrics section
+
+            # In the market_data.append, update the fundamentals section:
+            "fundamentals": {
+                "peRatios": financial_metrics.get("peRatios", {"trailingPE": None, "forwardPE": None}),
+                "estimates": financial_metrics.get("estimates", {
+                    "revenue": {"nextQuarter": None, "currentYear": None, "nextYear": None},
+                    "earnings": {"nextQuarter": None, "currentYear": None, "nextYear": None}
+                }),
+                "quarterlyMetrics": financial_metrics.get("quarterly", {
+                    "revenue": [],
+                    "revenueChange": [],
+                    "periods": []
+                }),
+                "detailedQuarterly": {
+                    "revenue": detailed_financials.get("revenue", []),
+                    "revenueChanges": detailed_financials.get("revenueChanges", []),
+                    "netIncome": detailed_financials.get("netIncome", []),
+                    "netIncomeChanges": detailed_financials.get("netIncomeChanges", []),
+                    "operatingMargin": detailed_financials.get("operatingMargin", []),
+                    "operatingMarginChanges": detailed_financials.get("operatingMarginChanges", []),
+                    "freeCashFlow": detailed_financials.get("freeCashFlow", []),
+                    "freeCashFlowChanges": detailed_financials.get("freeCashFlowChanges", []),
+                    "dates": detailed_financials.get("dates", [])
                 }
-                
-                
-                # Get 52-week high/low and additional data from yfinance
-                try:
-                    ticker = yf.Ticker(symbol)
-                    info = ticker.info
-                    
-                    # Get 52-week high/low data
-                    fifty_two_week_high = info.get('fiftyTwoWeekHigh')
-                    fifty_two_week_low = info.get('fiftyTwoWeekLow')
-                    
-                    # Calculate proximity to 52-week high
-                    current_price = latest['c']
-                    high_proximity_pct = None
-                    if fifty_two_week_high and current_price:
-                        high_proximity_pct = ((fifty_two_week_high - current_price) / fifty_two_week_high) * 100
-                    
-                    # Add new alert for proximity to 52-week high
-                    near_high_alert = high_proximity_pct is not None and high_proximity_pct <= 5  # Within 5% of 52-week high
-                    
-                except Exception as e:
-                    logger.error(f"Error fetching yfinance data for {symbol}: {str(e)}")
-                    fifty_two_week_high = None
-                    fifty_two_week_low = None
-                    high_proximity_pct = None
-                    near_high_alert = False
-                
-                # Get insider trades from yfinance
-                insider_summary = self.get_insider_data(symbol)
-                
-                # Get news from Polygon.io
-                news_data = self.get_news(symbol)
-                
-                investing_link = self.get_investing_url(symbol)
-                
-                try:
-                    financial_metrics = self.get_financials_metrics(symbol)
-                    detailed_financials = self.get_detailed_financials(symbol)
-                except Exception as e:
-                    logger.error(f"Error getting financial metrics for {symbol}: {str(e)}")
-                    financial_metrics = {}
-                    detailed_financials = {}
+            },
+            # Alert info
+            "alerts": alerts,
+            "alertDetails": {
+                "priceAlert": price_alert,
+                "volumeSpike10": volume_spike_10,
+                "volumeSpike20": volume_spike_20,
+                "highVolume": high_volume,
+                "insiderAlert": insider_alert,
+                "newsAlert": news_alert,
+                "technicalAlert": technical_alert,
+                "nearHighAlert": near_high_alert
+            }
+        }
 
-                
-                # Process news data
-                news_summary = [
-                    {
-                        "title": article.get('title'),
-                        "publisher": article.get('publisher', {}).get('name'),
-                        "timestamp": article.get('published_utc'),
-                        "url": article.get('article_url'),
-                        "type": article.get('tickers', [None])[0]
-                    }
-                    for article in (news_data.get('results', []) if news_data else [])
-                ]
-                
-                # Get RSI data
-                rsi_data = self.get_rsi(symbol)
-
-                # Calculate alerts
-                alerts = sum([
-                    abs(price_change_pct) > 5,  # 5% price movement
-                    volume_metrics['volume_24h_change'] >= 10,  # 10% volume spike
-                    volume_metrics['volume_24h_change'] >= 20,  # 20% volume spike
-                    bool(insider_summary['notable_trades']),  # Insider activity
-                    bool(news_summary),  # Recent news
-                    near_high_alert  # Near 52-week high
-                ])
-                
-                market_data.append({
-                    "symbol": symbol,
-                    "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    # Enhanced company info
-                        # Company names
-                    "names": {
-                        "long": company_details['names'].get('yfinance'),
-                        "short": company_details['names'].get('short'),
-                        "polygon": company_details['names'].get('polygon')
-                    },
-                    "sector": company_details['sector'],
-                    "industry": company_details['industry'],
-                    "description": company_details['description'],
-                    "branding": {
-                        "icon_url": company_details['icon_url'],
-                        "logo_url": company_details['logo_url']
-                    },
-                    "investing_url": investing_link,
-                    # Price data
-                    "price": latest['c'],
-                    "priceChange": price_change_pct,
-                    "openPrice": latest['o'],
-                    "prevClose": prev_day['c'],
-                    "dayHigh": latest['h'],
-                    "dayLow": latest['l'],
-                    # Volume data
-                    "volume": volume_metrics['current_volume'],
-                    "prevVolume": volume_metrics['prev_volume'],
-                    "volumeMetrics": {
-                        "recentVolumes": volume_metrics['recent_volumes'],
-                        "volumeDates": volume_metrics['volume_dates'],
-                        "dailyChanges": volume_metrics['daily_changes'],
-                        "averageVolume": volume_metrics['sma'],
-                        "volumeChange": volume_metrics['volume_24h_change'],
-                        "volumeVsAvg": volume_metrics['volume_vs_avg']
-                    },
-                    # Technical indicators
-                    "technicals": {
-                        "rsi": rsi_data['value'] if rsi_data else None,
-                        "volumeSMA": volume_metrics['sma']
-                    },
-                    # 52-week data
-                    "fiftyTwoWeekHigh": fifty_two_week_high,
-                    "fiftyTwoWeekLow": fifty_two_week_low,
-                    "highProximityPct": high_proximity_pct,
-                    # Market metrics
-                    "marketCap": ticker_info.get('market_cap', 0),
-                    # Additional data
-                    "insiderActivity": insider_summary,
-                    "recentNews": news_summary,
-                    # Add new metrics section
-
-                    # In the market_data.append, update the fundamentals section:
-                    "fundamentals": {
-                        "peRatios": financial_metrics.get("peRatios", {"trailingPE": None, "forwardPE": None}),
-                        "estimates": financial_metrics.get("estimates", {
-                            "revenue": {"nextQuarter": None, "currentYear": None, "nextYear": None},
-                            "earnings": {"nextQuarter": None, "currentYear": None, "nextYear": None}
-                        }),
-                        "quarterlyMetrics": financial_metrics.get("quarterly", {
-                            "revenue": [],
-                            "revenueChange": [],
-                            "periods": []
-                        }),
-                        "detailedQuarterly": {
-                            "revenue": detailed_financials.get("revenue", []),
-                            "revenueChanges": detailed_financials.get("revenueChanges", []),
-                            "netIncome": detailed_financials.get("netIncome", []),
-                            "netIncomeChanges": detailed_financials.get("netIncomeChanges", []),
-                            "operatingMargin": detailed_financials.get("operatingMargin", []),
-                            "operatingMarginChanges": detailed_financials.get("operatingMarginChanges", []),
-                            "freeCashFlow": detailed_financials.get("freeCashFlow", []),
-                            "freeCashFlowChanges": detailed_financials.get("freeCashFlowChanges", []),
-                            "dates": detailed_financials.get("dates", [])
-                        }
-                    },
-                    # Alert info
-                    "alerts": alerts,
-                    "alertDetails": {
-                        "priceAlert": abs(price_change_pct) > 5,
-                        "volumeSpike10": volume_metrics['volume_24h_change'] >= 10,
-                        "volumeSpike20": volume_metrics['volume_24h_change'] >= 20,
-                        "highVolume": volume_metrics['volume_vs_avg'] > 50,
-                        "insiderAlert": bool(insider_summary['notable_trades']),
-                        "newsAlert": bool(news_summary),
-                        "technicalAlert": (rsi_data and (rsi_data['value'] > 70 or rsi_data['value'] < 30)),
-                        "nearHighAlert": near_high_alert
-                    }
-                })
-                
-                logger.info(f"Successfully processed {symbol}")
-                
-            except Exception as e:
-                logger.error(f"Unexpected error processing {symbol}: {str(e)}")
-                continue
+    def clear_scan_cache(self):
+        """
+        Drop the per-run memoized yfinance Tickers, prefetched 52-week ranges and Polygon.io responses
+        """
+        _yf_ticker.cache_clear()
+        self._yf_info_cache.clear()
+        self._aggs_ranges.clear()
+        with self._memo_lock:
+            self._memo.clear()
+
+    def fetch_market_data(self, symbols: List[str], force_refresh: bool = False) -> int:
+        """
+        Fetch comprehensive market data using both Polygon.io and yfinance.
+        Records are streamed to disk in symbol order as they complete; returns how many were saved.
+        Symbols already saved today by an interrupted run are reused unless force_refresh is set.
+        """
+        data_dir = get_project_root() / 'data'
+        data_dir.mkdir(exist_ok=True)
+        market_data_path = data_dir / 'market_data.json'
+        
+        # Must be read before the writer reopens the partial file
+        resumed = {} if force_refresh else MarketDataWriter.load_partial(market_data_path)
+        if resumed:
+            logger.info(f"Resuming interrupted run with {len(resumed)} symbols already collected today")
+        
+        # Start each run with fresh yfinance data rather than Tickers left over from a previous run
+        self.clear_scan_cache()
+        self.scan_time = datetime.now()
+        self._prefetch_52_week_ranges([symbol for symbol in symbols if symbol not in resumed])
         
+        writer = MarketDataWriter(market_data_path)
+        run_timestamp = self.scan_time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Results that finished ahead of an earlier symbol wait here so the file keeps the requested order
+        pending = {}
+        next_index = 0
+        
+        def write_ready():
+            nonlocal next_index
+            while next_index in pending:
+                record = pending.pop(next_index)
+                next_index += 1
+                if record:
+                    # orjson writes NaN and +/-Infinity as null, so records need no scrubbing pass
+                    writer.write(record)
         
-        # Save to JSON file
         try:
-            cleaned_data, nan_fields = self.validate_numeric_fields(market_data)
-
-            market_data_path = get_project_root() / 'data' / 'market_data.json'
-            with market_data_path.open('w') as f:
-                json.dump(cleaned_data, f, indent=2)
-            logger.info(f"Saved data for {len(market_data)} stocks")
+            for index, symbol in enumerate(symbols):
+                if symbol in resumed:
+                    pending[index] = resumed[symbol]
+                    progress_tracker.update_progress(symbol)
+            write_ready()
+            
+            # Symbols are independent, so process them concurrently with a bounded pool
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._process_symbol, symbol, run_timestamp): (index, symbol)
+                    for index, symbol in enumerate(symbols) if symbol not in resumed
+                }
+                for future in as_completed(futures):
+                    index, symbol = futures[future]
+                    progress_tracker.update_progress(symbol)
+                    record = None
+                    try:
+                        record = future.result()
+                        if record:
+                            logger.info(f"Successfully processed {symbol}")
+                    except Exception as e:
+                        logger.error(f"Unexpected error processing {symbol}: {str(e)}")
+                    
+                    pending[index] = record
+                    write_ready()
         except Exception as e:
             logger.error(f"Error saving to JSON: {str(e)}")
+            writer.abort()
+            return 0
+        finally:
+            # The collector process outlives the run; don't hold every symbol's scraped data until the next one
+            self.clear_scan_cache()
+        
+        logger.info(f"Response cache stats: {self.cache.stats()}")
         
-        return market_data
+        if writer.count:
+            writer.commit()
+            logger.info(f"Saved data for {writer.count} stocks")
+        else:
+            # Keep the previous market data rather than replacing it with an empty list
+            writer.abort(discard=True)
+        return writer.count
+
 
+def _acquire_collection_lock():
+    """
+    Take the exclusive lock held for a whole collection, so the timer-driven collector and an
+    API-triggered refresh never stream market_data.json at the same time.
+    Returns the open lock file (closing it releases the lock), or None if another process holds it.
+    """
+    lock_path = get_project_root() / 'data' / '.collect.lock'
+    lock_path.parent.mkdir(exist_ok=True)
+    lock_file = lock_path.open('w')
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
 
 
-def main():
+def main(force_refresh: bool = False):
     POLYGON_KEY = os.getenv('POLYGON_API_KEY')
     if not POLYGON_KEY:
         error_msg = "POLYGON_API_KEY environment variable not set"
@@ -1128,54 +1352,30 @@ def main():
         progress_tracker.set_error(error_msg)
         return False
     
+    # Progress trackers are per process, so only a lock on disk can see a collection started elsewhere
+    collection_lock = _acquire_collection_lock()
+    if collection_lock is None:
+        error_msg = "Data collection already in progress"
+        logger.error(error_msg)
+        progress_tracker.set_error(error_msg)
+        return False
+    
     try:
         fetcher = HybridDataFetcher(POLYGON_KEY)
         
         # Initialize progress tracking with total number of tickers
         progress_tracker.start_collection(len(tickers))
-        all_market_data = []
         
-        # Process each ticker individually
-        for ticker in tickers:
-            try:
-                # Update progress for current ticker
-                progress_tracker.update_progress(ticker)
-                logger.info(f"Processing {ticker}")
-                
-                # Fetch data for this individual ticker
-                ticker_data = fetcher.fetch_market_data([ticker])
-                if ticker_data:
-                    all_market_data.extend(ticker_data)
-                
-                # Add a small delay to prevent rate limiting
-                time.sleep(0.2)
-                
-            except Exception as e:
-                logger.error(f"Error processing {ticker}: {str(e)}")
-                # Continue with next ticker rather than failing entirely
-                continue
+        # Fetch all tickers in one batch; progress is updated and records are saved as each one completes
+        saved = fetcher.fetch_market_data(tickers, force_refresh=force_refresh)
         
-        if not all_market_data:
+        if not saved:
             error_msg = "No market data collected"
             logger.error(error_msg)
             progress_tracker.set_error(error_msg)
             return False
-        
-        # Clean and save the collected data
-        cleaned_data, nan_fields = fetcher.validate_numeric_fields(all_market_data)
-        
-        # Save to data directory in project root
-        data_dir = get_project_root() / 'data'
-        data_dir.mkdir(exist_ok=True)
-        
-        # Update data file paths
-        market_data_path = get_project_root() / 'data' / 'market_data.json'     # Use this instead
-
-        
-        with market_data_path.open('w') as f:
-            json.dump(cleaned_data, f, indent=2)
             
-        logger.info(f"Saved market data to {market_data_path}")
+        logger.info(f"Saved market data to {get_project_root() / 'data' / 'market_data.json'}")
         progress_tracker.complete()
         return True
         
@@ -1184,6 +1384,8 @@ def main():
         logger.error(error_msg)
         progress_tracker.set_error(error_msg)
         return False
+    finally:
+        collection_lock.close()
     
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,62 +1,115 @@
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from datetime import datetime
+import threading
 
 class ProgressTracker:
+    _STATE_FIELDS = ("total_tickers", "processed_tickers", "current_ticker", "start_time", "is_running", "error")
+    
     def __init__(self):
+        self._listeners = []
+        # Guards the state fields; updates arrive from worker/relay threads while the event loop reads status
+        self._lock = threading.Lock()
         self.reset()
     
+    def add_listener(self, listener: Callable[[], None]):
+        """Register a callback run after every state change (called from the thread making the change)"""
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[], None]):
+        """Unregister a callback added with add_listener"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self):
+        for listener in list(self._listeners):
+            listener()
+    
     def reset(self):
         """Reset all tracking variables to initial state"""
-        self.total_tickers = 0
-        self.processed_tickers = 0
-        self.current_ticker = ""
-        self.start_time = None
-        self.is_running = False
-        self.error = None
+        with self._lock:
+            self.total_tickers = 0
+            self.processed_tickers = 0
+            self.current_ticker = ""
+            self.start_time = None
+            self.is_running = False
+            self.error = None
+        self._notify()
     
     def start_collection(self, total_tickers: int):
         """Start a new collection process"""
-        self.total_tickers = total_tickers
-        self.processed_tickers = 0
-        self.start_time = datetime.now()
-        self.is_running = True
-        self.error = None
+        with self._lock:
+            self.total_tickers = total_tickers
+            self.processed_tickers = 0
+            self.current_ticker = ""
+            self.start_time = datetime.now()
+            self.is_running = True
+            self.error = None
+        self._notify()
     
     def update_progress(self, ticker: str):
         """Update progress with the current ticker being processed"""
-        self.current_ticker = ticker
-        self.processed_tickers += 1
+        with self._lock:
+            self.current_ticker = ticker
+            self.processed_tickers += 1
+        self._notify()
     
     def set_error(self, error: str):
         """Set an error message and stop the collection"""
-        self.error = error
-        self.is_running = False
+        with self._lock:
+            self.error = error
+            self.is_running = False
+        self._notify()
     
     def complete(self):
         """Mark the collection as complete"""
-        self.is_running = False
+        with self._lock:
+            self.is_running = False
+        self._notify()
+    
+    def snapshot(self) -> Dict:
+        """Raw tracker state, e.g. to relay progress from another process"""
+        with self._lock:
+            return {key: getattr(self, key) for key in self._STATE_FIELDS}
+    
+    def restore(self, state: Dict):
+        """Apply a state captured with snapshot()"""
+        with self._lock:
+            for key in self._STATE_FIELDS:
+                if key in state:
+                    setattr(self, key, state[key])
+        self._notify()
     
     def get_status(self) -> Dict:
         """Get the current status of the collection process"""
-        if not self.start_time:
+        # Read a consistent view so progress never mixes counts from two updates
+        with self._lock:
+            total = self.total_tickers
+            processed = self.processed_tickers
+            current_ticker = self.current_ticker
+            started = self.start_time is not None
+            is_running = self.is_running
+            error = self.error
+        
+        if not started:
             return {
                 "status": "idle",
                 "progress": 0,
                 "current_ticker": "",
                 "total_tickers": 0,
                 "processed_tickers": 0,
-                "error": self.error
+                "error": error
             }
         
-        progress = (self.processed_tickers / self.total_tickers * 100) if self.total_tickers > 0 else 0
+        progress = (processed / total * 100) if total > 0 else 0
         
+        # A fresh dict each call: the SSE stream detects changes by comparing it with the last one sent
         return {
-            "status": "running" if self.is_running else "complete",
+            "status": "running" if is_running else "complete",
             "progress": round(progress, 2),
-            "current_ticker": self.current_ticker,
-            "total_tickers": self.total_tickers,
-            "processed_tickers": self.processed_tickers,
-            "error": self.error
+            "current_ticker": current_ticker,
+            "total_tickers": total,
+            "processed_tickers": processed,
+            "error": error
         }
 
 # Create a single instance to be used throughout the application
@@ -64,4 +117,4 @@ _progress_tracker = ProgressTracker()
 
 def get_progress_tracker() -> ProgressTracker:
     """Get the singleton instance of the progress tracker"""
-    return _progress_tracker
\ No newline at end of file
+    return _progress_tracker
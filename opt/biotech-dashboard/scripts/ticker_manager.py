@@ -1,48 +1,135 @@
 # backend/data/ticker_manager.py
-import json
+import asyncio
+import orjson
 import os
+import tempfile
+import time
 from pathlib import Path
 import logging
-import yfinance as yf
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Tuple
 from dotenv import load_dotenv
 
+try:
+    from .cache import FileCache
+except ImportError:
+    from cache import FileCache
+
 # Load environment variables
 load_dotenv()
 POLYGON_KEY = os.getenv('POLYGON_API_KEY')
+POLYGON_BASE_URL = "https://api.polygon.io"
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds cached lookups stay fresh: searches repeat while typing, company metadata barely changes
+SEARCH_CACHE_TTL = 300
+REFERENCE_CACHE_TTL = 24 * 3600
+YF_INFO_CACHE_TTL = 3600
+COMPANY_DETAILS_CACHE_TTL = 7 * 24 * 3600
+SEARCH_CACHE_MAX_ENTRIES = 1024
+
+# (connect, read) seconds for the sync Polygon.io lookups
+REQUEST_TIMEOUT = (3, 10)
+
+SEARCH_RESULT_LIMIT = 10
+# Substring length indexed for stored-ticker search; shorter queries fall back to a scan
+SEARCH_GRAM_SIZE = 3
+# Attempts for a Polygon.io search, backing off SEARCH_RETRY_BACKOFF * 2**n seconds between them
+SEARCH_RETRIES = 3
+SEARCH_RETRY_BACKOFF = 0.3
+# Symbols validated in parallel by a bulk add (each lookup is a Polygon.io call plus a possible yfinance scrape)
+BULK_ADD_WORKERS = 8
+# Caps on outgoing async Polygon.io searches so concurrent typeahead users don't trip the key's rate limit
+SEARCH_MAX_CONCURRENCY = int(os.getenv('POLYGON_SEARCH_CONCURRENCY', '5'))
+SEARCH_RATE_LIMIT = int(os.getenv('POLYGON_SEARCH_RATE_LIMIT', '100'))
+SEARCH_RATE_WINDOW = 60
 
 
 class TickerManager:
-    def __init__(self):
+    def __init__(self, http: httpx.AsyncClient = None):
         if os.getenv('ENV') == 'development':
             root_dir = Path(__file__).parent.parent
         else:
             root_dir = Path("/opt/biotech-dashboard")
         self.tickers_file = root_dir / 'data' / 'tickers.json'
         self.tickers_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache = FileCache(root_dir / '.cache')
         
         self.polygon_key = POLYGON_KEY
+        # Serializes read-modify-write updates of tickers.json from concurrent callers
+        self._update_lock = threading.Lock()
+        # Parsed tickers.json, keyed by its (mtime, size) when it was read or written
+        self._data_cache = None
+        # Stored-ticker search index, built on the first search and keyed by tickers.json's (mtime, size)
+        self._search_index = None
+        # Serialized /api/tickers payload, keyed by tickers.json's (mtime, size) when it was built
+        self._tickers_response_cache = None
+        # Tracked symbols as a set, keyed by tickers.json's (mtime, size); add/remove mutate it in place
+        self._ticker_set_cache = None
+        # Keep-alive connections shared by Polygon.io lookups and yfinance
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        # Transient Polygon.io failures are retried before a lookup gives up and reports the ticker as invalid.
+        # Only that host: yfinance sees Yahoo's 429s as rate limiting, and retrying them would only extend it.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False
+        )
+        self._session.mount(POLYGON_BASE_URL, HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        # Polygon.io search results by query, shared by the sync and async search paths
+        self._search_cache: Dict[str, Tuple[float, List[Dict[str, str]]]] = {}
+        # Async client for polygon_search; the API server hands over its shared pool once it starts.
+        # Requests are relative to POLYGON_BASE_URL and rely on the client sending apiKey by default.
+        self.http = http
+        self._search_slots = asyncio.Semaphore(SEARCH_MAX_CONCURRENCY)
+        # Monotonic start times of the searches sent in the last SEARCH_RATE_WINDOW seconds
+        self._search_calls = deque()
+        # Searches currently waiting on Polygon.io, so concurrent identical queries share one request
+        self._search_inflight: Dict[str, asyncio.Future] = {}
+    
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self._session.close()
         
-    def _make_polygon_request(self, endpoint: str) -> Dict:
-        """Make a request to the Polygon.io API"""
-        base_url = "https://api.polygon.io"
-        url = f"{base_url}{endpoint}?apiKey={self.polygon_key}"
+    def _make_polygon_request(self, endpoint: str, params: Dict = None, ttl: int = 0) -> Dict:
+        """Make a request to the Polygon.io API, answering from the file cache when ttl is set"""
+        cache_key = FileCache.make_key(endpoint, params)
+        if ttl:
+            cached = self.cache.get(cache_key, ttl)
+            if cached is not None:
+                return cached
         
         try:
-            response = requests.get(url)
+            # Not a session-wide default: the session is shared with yfinance, which must never see the key
+            response = self._session.get(POLYGON_BASE_URL + endpoint, params={**(params or {}), 'apiKey': self.polygon_key}, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content)
+            if ttl:
+                self.cache.set(cache_key, data)
+            return data
         except Exception as e:
             logger.error(f"Polygon API request failed: {str(e)}")
             return {}
 
     def get_company_details(self, symbol: str) -> Dict[str, Any]:
         """Get essential company details from Polygon.io with yfinance fallback"""
+        # Merged lookups are reused, so re-adding or re-validating a symbol makes no API calls
+        cache_key = f"company_details:{symbol}"
+        cached = self.cache.get(cache_key, COMPANY_DETAILS_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
         try:
             company_details = {
                 "name": "",
@@ -54,7 +141,7 @@ class TickerManager:
             logger.info(f"Fetching data for {symbol} from Polygon.io")
             try:
                 endpoint = f"/v3/reference/tickers/{symbol}"
-                polygon_data = self._make_polygon_request(endpoint)
+                polygon_data = self._make_polygon_request(endpoint, ttl=REFERENCE_CACHE_TTL)
                 
                 if polygon_data and 'results' in polygon_data:
                     results = polygon_data['results']
@@ -66,6 +153,7 @@ class TickerManager:
                     
                     # If we got all the data we need from Polygon, return early
                     if all(v != "Unknown" and v != "" for v in company_details.values()):
+                        self.cache.set(cache_key, company_details)
                         return company_details
                         
             except Exception as e:
@@ -74,8 +162,12 @@ class TickerManager:
             # Get additional data from yfinance if needed
             logger.info(f"Fetching additional data for {symbol} from yfinance")
             try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
+                # A symbol Polygon.io doesn't know is usually a typo; reject it with a cheap quote
+                # lookup before paying for the full info scrape
+                if not company_details["name"] and not self._has_yf_quote(symbol):
+                    return company_details
+                
+                info = self._get_yf_info(symbol)
                 
                 # Update with yfinance data only if Polygon didn't provide it
                 if not company_details["name"]:
@@ -85,6 +177,10 @@ class TickerManager:
                 if company_details["industry"] == "Unknown":
                     company_details["industry"] = info.get('industry', 'Unknown')
                 
+                # Only a lookup that completed is worth keeping; errors are retried next time
+                if company_details["name"]:
+                    self.cache.set(cache_key, company_details)
+                
             except Exception as e:
                 logger.error(f"Error fetching yfinance company data: {str(e)}")
             
@@ -98,39 +194,149 @@ class TickerManager:
                 "industry": "Unknown"
             }
 
+    def _get_yf_info(self, symbol: str) -> Dict[str, Any]:
+        """The yfinance name/sector/industry fields for a symbol, cached for YF_INFO_CACHE_TTL seconds"""
+        cache_key = f"yf_info:{symbol}"
+        cached = self.cache.get(cache_key, YF_INFO_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        # yfinance pulls in pandas; import it only when a lookup needs it
+        import yfinance as yf
+        info = yf.Ticker(symbol, session=self._session).info
+        fields = {key: info.get(key) for key in ('longName', 'sector', 'industry') if info.get(key) is not None}
+        self.cache.set(cache_key, fields)
+        return fields
+
+    def _has_yf_quote(self, symbol: str) -> bool:
+        """Whether yfinance has a last price for the symbol, via its lightweight fast_info quote"""
+        import yfinance as yf
+        try:
+            return yf.Ticker(symbol, session=self._session).fast_info.get('lastPrice') is not None
+        except Exception as e:
+            logger.warning(f"yfinance quote lookup failed for {symbol}: {str(e)}")
+            return False
+
     def get_tickers(self):
         """Read tickers from JSON file"""
         try:
-            print(f"Attempting to read tickers from: {self.tickers_file.absolute()}")  # Debug line
-            with open(self.tickers_file, 'r') as f:
-                data = json.load(f)
-                tickers = data.get('tickers', [])
-                print(f"Found {len(tickers)} tickers")  # Debug line
-                return tickers
+            logger.debug("Reading tickers from: %s", self.tickers_file)
+            tickers = list(self._read_data().get('tickers', []))
+            logger.debug("Found %d tickers", len(tickers))
+            return tickers
         except FileNotFoundError:
-            print(f"File not found: {self.tickers_file.absolute()}")  # Debug line
+            logger.warning("Tickers file not found, creating an empty one: %s", self.tickers_file)
             self.save_tickers([])
             return []
-        except json.JSONDecodeError:
-            print(f"Invalid JSON in {self.tickers_file}")  # Debug line
+        except orjson.JSONDecodeError:
+            logger.error("Invalid JSON in %s", self.tickers_file)
             return []
     
     def get_ticker_details(self):
         """Read full ticker details from JSON file"""
+        return self.get_all()[1]
+
+    def get_all(self) -> Tuple[List[str], Dict[str, Dict]]:
+        """Tracked symbols and their details, from a single (cached) read of tickers.json"""
         try:
-            with open(self.tickers_file, 'r') as f:
-                data = json.load(f)
-                return data.get('ticker_details', {})
+            data = self._read_data()
         except FileNotFoundError:
-            return {}
-        except json.JSONDecodeError:
+            return [], {}
+        except orjson.JSONDecodeError:
             logger.error(f"Invalid JSON in {self.tickers_file}")
-            return {}
+            return [], {}
+        # Shallow copies: add/remove edit the returned containers before saving them
+        return list(data.get('tickers', [])), dict(data.get('ticker_details', {}))
+            
+    def _read_data(self) -> Dict[str, Any]:
+        """Parsed tickers.json, re-read only if the file changed since the last read or write"""
+        version = self._file_version()
+        cached = self._data_cache
+        if cached is None or cached[0] != version:
+            cached = self._data_cache = (version, orjson.loads(self.tickers_file.read_bytes()))
+        return cached[1]
+
+    def _file_version(self):
+        """tickers.json's (mtime, size), or None if it doesn't exist; changes whenever the file is rewritten"""
+        try:
+            stat = self.tickers_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _ticker_set(self) -> set:
+        """The tracked symbols, re-read only if tickers.json changed since the last read or write"""
+        version = self._file_version()
+        cached = self._ticker_set_cache
+        if cached is None or cached[0] != version:
+            cached = self._ticker_set_cache = (version, set(self.get_tickers()))
+        return cached[1]
+
+    def cached_tickers_response(self) -> bytes:
+        """The JSON-encoded list of tracked tickers with their details, rebuilt only when tickers.json changes"""
+        version = self._file_version()
+        cached = self._tickers_response_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        tickers, details = self.get_all()
+        empty = {}
+        entries = [
+            {
+                "symbol": symbol,
+                "name": (detail := details.get(symbol, empty)).get("name", ""),
+                "sector": detail.get("sector", ""),
+                "industry": detail.get("industry", ""),
+                "names": detail.get("names", {})
+            }
+            for symbol in tickers
+        ]
+        payload = orjson.dumps({"tickers": entries})
+        self._tickers_response_cache = (version, payload)
+        return payload
+
+    def _build_search_index(self):
+        """
+        Precompute one upper-cased haystack per stored ticker, plus a map from every trigram to the
+        positions of the haystacks containing it, so longer queries only test tickers sharing all their trigrams
+        """
+        # NUL never appears in a query, so matches can't span two fields
+        entries = [
+            ("\0".join((symbol, info.get('name', ''), info.get('sector', ''), info.get('industry', ''))).upper(), symbol, info)
+            for symbol, info in self.get_ticker_details().items()
+        ]
+        grams: Dict[str, set] = {}
+        for position, (haystack, _, _) in enumerate(entries):
+            for start in range(len(haystack) - SEARCH_GRAM_SIZE + 1):
+                grams.setdefault(haystack[start:start + SEARCH_GRAM_SIZE], set()).add(position)
+        return entries, grams
+
+    def match_stored(self, query: str):
+        """Stored (symbol, details) pairs whose symbol, name, sector or industry contain the query"""
+        # Rebuilt whenever tickers.json changes, including edits made outside this process
+        version = self._file_version()
+        cached = self._search_index
+        if cached is None or cached[0] != version:
+            cached = self._search_index = (version, self._build_search_index())
+        entries, grams = cached[1]
+        query = query.upper().strip()
+        
+        if len(query) < SEARCH_GRAM_SIZE:
+            candidates = range(len(entries))
+        else:
+            # Intersect smallest-first; survivors still get the substring test since trigrams can occur out of order
+            postings = sorted(
+                (grams.get(query[start:start + SEARCH_GRAM_SIZE], set()) for start in range(len(query) - SEARCH_GRAM_SIZE + 1)),
+                key=len
+            )
+            candidates = sorted(postings[0].intersection(*postings[1:]))
+        return [(entries[position][1], entries[position][2]) for position in candidates if query in entries[position][0]]
             
     def save_tickers(self, tickers, ticker_details=None):
         """Save tickers and their details to JSON file"""
         try:
-            unique_tickers = sorted(list(set(tickers)))
+            ticker_set = tickers if isinstance(tickers, set) else set(tickers)
+            unique_tickers = sorted(ticker_set)
             current_data = {
                 'tickers': unique_tickers,
                 'ticker_details': ticker_details or {}
@@ -139,20 +345,36 @@ class TickerManager:
             # If updating just tickers, preserve existing details
             if ticker_details is None:
                 try:
-                    with open(self.tickers_file, 'r') as f:
-                        existing_data = json.load(f)
-                        current_data['ticker_details'] = existing_data.get('ticker_details', {})
-                except (FileNotFoundError, json.JSONDecodeError):
+                    current_data['ticker_details'] = self._read_data().get('ticker_details', {})
+                except (FileNotFoundError, orjson.JSONDecodeError):
                     pass
             
-            with open(self.tickers_file, 'w') as f:
-                json.dump(current_data, f, indent=2)
+            self._write_atomic(orjson.dumps(current_data, option=orjson.OPT_INDENT_2))
+            version = self._file_version()
+            self._data_cache = (version, current_data)
+            self._search_index = None
+            self._tickers_response_cache = None
+            self._ticker_set_cache = (version, ticker_set)
             logger.info(f"Saved {len(unique_tickers)} tickers to {self.tickers_file}")
             return True
         except Exception as e:
+            # add/remove may already have changed the cached set; re-read the file next time
+            self._ticker_set_cache = None
+            self._data_cache = None
             logger.error(f"Error saving tickers: {str(e)}")
             return False
 
+    def _write_atomic(self, payload: bytes):
+        """Replace tickers.json in one step so concurrent readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.tickers_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.tickers_file)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
     def add_ticker(self, symbol: str) -> bool:
         """Add a new ticker after validation and fetch company details"""
         symbol = symbol.upper()
@@ -165,14 +387,15 @@ class TickerManager:
                 logger.warning(f"Could not validate ticker: {symbol}")
                 return False
 
-            current_tickers = self.get_tickers()
-            current_details = self.get_ticker_details()
-            
-            if symbol not in current_tickers:
-                current_tickers.append(symbol)
-                # Store the comprehensive company details
-                current_details[symbol] = company_details
-                return self.save_tickers(current_tickers, current_details)
+            with self._update_lock:
+                current_tickers = self._ticker_set()
+                
+                if symbol not in current_tickers:
+                    current_details = self.get_ticker_details()
+                    current_tickers.add(symbol)
+                    # Store the comprehensive company details
+                    current_details[symbol] = company_details
+                    return self.save_tickers(current_tickers, current_details)
             
             return True
 
@@ -180,71 +403,159 @@ class TickerManager:
             logger.error(f"Error adding ticker {symbol}: {str(e)}")
             return False
 
+    def add_tickers(self, symbols: List[str]) -> Dict[str, bool]:
+        """
+        Validate and add several tickers at once: lookups run concurrently and tickers.json is written once.
+        Returns whether each symbol is tracked afterwards.
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        already_tracked = self._ticker_set()
+        to_validate = [symbol for symbol in symbols if symbol not in already_tracked]
+        
+        with ThreadPoolExecutor(max_workers=BULK_ADD_WORKERS) as pool:
+            lookups = dict(zip(to_validate, pool.map(self.get_company_details, to_validate)))
+        valid = {symbol: details for symbol, details in lookups.items() if details["name"]}
+        for symbol in lookups.keys() - valid.keys():
+            logger.warning(f"Could not validate ticker: {symbol}")
+        
+        with self._update_lock:
+            current_tickers = self._ticker_set()
+            new_details = {symbol: details for symbol, details in valid.items() if symbol not in current_tickers}
+            saved = True
+            if new_details:
+                current_details = self.get_ticker_details()
+                current_details.update(new_details)
+                saved = self.save_tickers(current_tickers.union(new_details), current_details)
+            tracked = self._ticker_set() if saved else current_tickers
+            return {symbol: symbol in tracked for symbol in symbols}
+
     def remove_ticker(self, symbol: str) -> bool:
         """Remove a ticker from the list"""
         symbol = symbol.upper()
         try:
-            current_tickers = self.get_tickers()
-            current_details = self.get_ticker_details()
-            
-            if symbol not in current_tickers:
-                logger.warning(f"Ticker {symbol} not found")
-                return False
+            with self._update_lock:
+                current_tickers = self._ticker_set()
+                
+                if symbol not in current_tickers:
+                    logger.warning(f"Ticker {symbol} not found")
+                    return False
 
-            current_tickers.remove(symbol)
-            if symbol in current_details:
-                del current_details[symbol]
-            
-            return self.save_tickers(current_tickers, current_details)
+                current_details = self.get_ticker_details()
+                current_tickers.discard(symbol)
+                current_details.pop(symbol, None)
+                
+                return self.save_tickers(current_tickers, current_details)
 
         except Exception as e:
             logger.error(f"Error removing ticker {symbol}: {str(e)}")
             return False
 
+    @staticmethod
+    def _search_params(query: str) -> Dict[str, Any]:
+        return {'search': query, 'active': 'true', 'limit': SEARCH_RESULT_LIMIT}
+
+    @staticmethod
+    def _parse_search_results(data: Dict) -> List[Dict[str, str]]:
+        return [{
+            'symbol': item.get('ticker', ''),
+            'name': item.get('name', ''),
+            'sector': item.get('sic_sector', ''),
+            'industry': item.get('sic_industry', '')
+        } for item in data.get('results', [])]
+
+    def _cached_search(self, query: str):
+        cached = self._search_cache.get(query)
+        if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def _store_search(self, query: str, results: List[Dict[str, str]]):
+        if len(self._search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+            self._search_cache.clear()
+        self._search_cache[query] = (time.monotonic(), results)
+
+    async def _wait_for_search_quota(self):
+        """Sleep until another search fits in the sliding rate window, then claim it"""
+        while True:
+            now = time.monotonic()
+            while self._search_calls and now - self._search_calls[0] >= SEARCH_RATE_WINDOW:
+                self._search_calls.popleft()
+            if len(self._search_calls) < SEARCH_RATE_LIMIT:
+                self._search_calls.append(now)
+                return
+            await asyncio.sleep(SEARCH_RATE_WINDOW - (now - self._search_calls[0]))
+
+    async def polygon_search(self, query: str) -> List[Dict[str, str]]:
+        """Search Polygon.io for tickers matching query, retrying transient failures"""
+        query = query.upper().strip()
+        cached = self._cached_search(query)
+        if cached is not None:
+            return cached
+        
+        pending = self._search_inflight.get(query)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_polygon_search(query))
+            self._search_inflight[query] = pending
+            pending.add_done_callback(lambda _: self._search_inflight.pop(query, None))
+        # Shielded so one caller disconnecting doesn't cancel the request the others are awaiting
+        return await asyncio.shield(pending)
+
+    async def _fetch_polygon_search(self, query: str) -> List[Dict[str, str]]:
+        """Run one Polygon.io search for an already normalized query and cache the results"""
+        params = self._search_params(query)
+        for attempt in range(SEARCH_RETRIES):
+            try:
+                async with self._search_slots:
+                    await self._wait_for_search_quota()
+                    response = await self.http.get("/v3/reference/tickers", params=params)
+                response.raise_for_status()
+                results = self._parse_search_results(orjson.loads(response.content))
+                self._store_search(query, results)
+                return results
+            except httpx.HTTPStatusError as e:
+                # Client errors won't go away on retry
+                if e.response.status_code < 500 and e.response.status_code != 429:
+                    logger.error(f"Polygon search error: {str(e)}")
+                    return []
+                error = e
+            except (httpx.TransportError, orjson.JSONDecodeError) as e:
+                error = e
+            if attempt + 1 < SEARCH_RETRIES:
+                await asyncio.sleep(SEARCH_RETRY_BACKOFF * 2 ** attempt)
+        
+        logger.error(f"Polygon search failed after {SEARCH_RETRIES} attempts: {str(error)}")
+        return []
+
     def search_tickers(self, query: str):
         """Search through stored tickers and their details"""
         try:
             logger.info(f"Starting search with query: {query}")
-            details = self.get_ticker_details()
             query = query.upper().strip()
-            results = []
             
             # First search through stored tickers
-            for symbol, info in details.items():
-                # Check if query matches any of the fields
-                if any([
-                    query in symbol.upper(),
-                    query in info.get('name', '').upper(),
-                    query in info.get('sector', '').upper(),
-                    query in info.get('industry', '').upper()
-                ]):
-                    results.append({
-                        'symbol': symbol,
-                        'name': info.get('name', ''),
-                        'sector': info.get('sector', ''),
-                        'industry': info.get('industry', '')
-                    })
+            results = [
+                {
+                    'symbol': symbol,
+                    'name': info.get('name', ''),
+                    'sector': info.get('sector', ''),
+                    'industry': info.get('industry', '')
+                }
+                for symbol, info in self.match_stored(query)
+            ]
             
             logger.info(f"Search found {len(results)} results in stored tickers")
             
             # If no results found, try searching with Polygon
             if not results:
-                try:
-                    endpoint = f"/v3/reference/tickers?search={query}&active=true&limit=10"
-                    polygon_data = self._make_polygon_request(endpoint)
-                    
-                    if polygon_data and 'results' in polygon_data:
-                        for item in polygon_data['results']:
-                            results.append({
-                                'symbol': item.get('ticker', ''),
-                                'name': item.get('name', ''),
-                                'sector': item.get('sic_sector', ''),
-                                'industry': item.get('sic_industry', '')
-                            })
-                except Exception as e:
-                    logger.error(f"Polygon search error: {str(e)}")
+                polygon_results = self._cached_search(query)
+                if polygon_results is None:
+                    polygon_data = self._make_polygon_request("/v3/reference/tickers", self._search_params(query))
+                    polygon_results = self._parse_search_results(polygon_data)
+                    if polygon_data:
+                        self._store_search(query, polygon_results)
+                results.extend(polygon_results)
             
-            return results[:10]  # Limit to top 10 matches
+            return results[:SEARCH_RESULT_LIMIT]
                 
         except Exception as e:
             logger.error(f"Search error: {str(e)}")
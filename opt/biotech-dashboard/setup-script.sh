@@ -37,7 +37,7 @@ After=network.target
 [Service]
 User=biotech
 WorkingDirectory=/opt/biotech-dashboard/api
-ExecStart=/opt/biotech-dashboard/venv/bin/uvicorn server:app --host 0.0.0.0 --port 8000
+ExecStart=/opt/biotech-dashboard/venv/bin/uvicorn server:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --log-level warning
 Restart=always
 
 [Install]
@@ -0,0 +1,7 @@
+import os
+import sys
+from pathlib import Path
+
+# Resolve data/ and .cache/ inside this checkout instead of /opt/biotech-dashboard
+os.environ.setdefault('ENV', 'development')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,49 @@
+import queue
+import sys
+import types
+
+import pytest
+
+from scripts.collect import collect_with_progress
+from scripts.progress_tracker import get_progress_tracker
+
+
+@pytest.fixture
+def tracker():
+    tracker = get_progress_tracker()
+    listeners = list(tracker._listeners)
+    yield tracker
+    tracker.reset()
+    assert tracker._listeners == listeners
+
+
+def fake_collector(monkeypatch, main):
+    module = types.ModuleType('scripts.polygon_fetch')
+    module.main = main
+    monkeypatch.setitem(sys.modules, 'scripts.polygon_fetch', module)
+
+
+def test_progress_is_relayed_until_the_collection_ends(monkeypatch, tracker):
+    def main():
+        tracker.start_collection(2)
+        tracker.update_progress('ABCD')
+        return True
+    fake_collector(monkeypatch, main)
+    progress = queue.Queue()
+    
+    assert collect_with_progress(progress) is True
+    assert progress.get_nowait()['is_running'] is True
+    assert progress.get_nowait()['current_ticker'] == 'ABCD'
+    
+    # The worker process is reused, so a finished run must not keep feeding its queue
+    tracker.update_progress('EFGH')
+    assert progress.empty()
+
+
+def test_listener_is_removed_when_the_collection_fails(monkeypatch, tracker):
+    def main():
+        raise RuntimeError('collector crashed')
+    fake_collector(monkeypatch, main)
+    
+    with pytest.raises(RuntimeError):
+        collect_with_progress(queue.Queue())
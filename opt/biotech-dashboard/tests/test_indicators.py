@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from scripts.indicators import rsi_wilder
+
+
+def test_rsi_wilder_smooths_after_the_seed_window():
+    # Seed averages over the first two changes (+1, -1) give 50; Wilder smoothing of the next +1 gives 75
+    out = rsi_wilder(np.array([1.0, 2.0, 1.0, 2.0]), 2)
+    
+    assert np.isnan(out[:2]).all()
+    assert out[2:].tolist() == pytest.approx([50.0, 75.0])
+
+
+@pytest.mark.parametrize('step, expected', [(1.0, 100.0), (-1.0, 0.0)])
+def test_rsi_wilder_one_way_series(step, expected):
+    closes = 100.0 + step * np.arange(30, dtype=np.float64)
+    out = rsi_wilder(closes, 14)
+    
+    assert np.isnan(out[:14]).all()
+    assert (out[14:] == expected).all()
+
+
+def test_rsi_wilder_needs_more_than_one_period():
+    assert np.isnan(rsi_wilder(np.arange(14, dtype=np.float64), 14)).all()
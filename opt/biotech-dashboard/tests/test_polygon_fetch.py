@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import orjson
+import pytest
+
+from scripts import polygon_fetch
+from scripts.cache import FileCache
+from scripts.polygon_fetch import MARKET_TZ, HybridDataFetcher, MarketDataWriter, TokenBucket, _bar_dates, _pct_changes, _seconds_since_settle, _yf_ticker
+
+DAILY_AGGS = '/v2/aggs/ticker/ABCD/range/1/day/2024-01-01/2024-03-01'
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    fetcher = HybridDataFetcher('test-key')
+    fetcher.cache = FileCache(tmp_path)
+    yield fetcher
+    fetcher.clear_scan_cache()
+
+
+def market_time(*args):
+    return datetime(*args, tzinfo=MARKET_TZ)
+
+
+@pytest.mark.parametrize('now, expected', [
+    # Wednesday, mid-session and just before the settle
+    (market_time(2024, 3, 6, 10, 0), 0),
+    (market_time(2024, 3, 6, 16, 59), 0),
+    # Wednesday evening and the next morning before the open
+    (market_time(2024, 3, 6, 18, 0), 3600),
+    (market_time(2024, 3, 7, 8, 0), 15 * 3600),
+    # The weekend and Monday's pre-market count from Friday's settle
+    (market_time(2024, 3, 9, 12, 0), 19 * 3600),
+    (market_time(2024, 3, 11, 9, 29), 64 * 3600 + 29 * 60),
+])
+def test_seconds_since_settle(now, expected):
+    assert _seconds_since_settle(now) == expected
+
+
+def test_daily_bar_ttl_follows_the_clock(fetcher, monkeypatch):
+    monkeypatch.setattr(polygon_fetch, '_seconds_since_settle', lambda: 0)
+    assert fetcher._cache_ttl(DAILY_AGGS) == 5 * 60
+    
+    monkeypatch.setattr(polygon_fetch, '_seconds_since_settle', lambda: 7200)
+    assert fetcher._cache_ttl(DAILY_AGGS) == 7200
+    assert fetcher._cache_ttl('/v3/reference/tickers/ABCD') == 24 * 3600
+    assert fetcher._cache_ttl('/v1/unlisted') == 0
+
+
+def test_seconds_since_settle_is_not_memoized():
+    assert not hasattr(_seconds_since_settle, 'cache_info')
+
+
+def test_yf_ticker_is_shared_until_the_scan_cache_is_cleared(fetcher):
+    ticker = _yf_ticker('ABCD')
+    assert _yf_ticker('ABCD') is ticker
+    
+    fetcher.clear_scan_cache()
+    assert _yf_ticker('ABCD') is not ticker
+
+
+def test_bar_dates_formats_millisecond_timestamps():
+    bars = [{'t': 1709251200000}, {'t': 1709510400000}]
+    assert _bar_dates(bars) == ['2024-03-01', '2024-03-04']
+    assert _bar_dates([]) == []
+
+
+def test_pct_changes_skips_non_positive_bases():
+    values = np.array([100.0, 150.0, 0.0, 30.0, 15.0])
+    assert _pct_changes(values) == [50.0, -100.0, 0.0, -50.0]
+    assert _pct_changes(np.array([42.0])) == []
+
+
+def test_rsi_reads_the_shared_daily_series(fetcher):
+    rising = [{'c': 100.0 + day} for day in range(60)]
+    assert fetcher.get_rsi(rising) == {'value': 100.0}
+    # Too few bars for one RSI period
+    assert fetcher.get_rsi(rising[:14]) is None
+
+
+def test_yf_info_cache_follows_the_settle_clock(fetcher, monkeypatch):
+    ttls = []
+    monkeypatch.setattr(fetcher.cache, 'get', lambda key, ttl: ttls.append(ttl) or {'trailingPE': 12.5})
+    
+    monkeypatch.setattr(polygon_fetch, '_seconds_since_settle', lambda: 0)
+    assert fetcher.get_yf_info('ABCD') == {'trailingPE': 12.5}
+    monkeypatch.setattr(polygon_fetch, '_seconds_since_settle', lambda: 7200)
+    fetcher.get_yf_info('ABCD')
+    
+    # Intraday the PE ratios and 52-week fallback expire like the bars; overnight they last until the open
+    assert ttls == [polygon_fetch.YF_INFO_CACHE_TTL, 7200]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(polygon_fetch.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(polygon_fetch.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+    
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+    
+    # Idle time refills the bucket, but never past its capacity
+    clock.now += 60
+    clock.sleeps.clear()
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_drain_holds_callers_off(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    bucket.drain(delay=1)
+    
+    bucket.acquire()
+    # One second of backoff, then half a second to earn the token itself
+    assert sum(clock.sleeps) == pytest.approx(1.5)
+
+
+def test_market_data_writer_replaces_the_target_on_commit(tmp_path):
+    target = tmp_path / 'market_data.json'
+    target.write_bytes(b'[{"symbol": "OLD"}]')
+    writer = MarketDataWriter(target)
+    writer.write({'symbol': 'ABCD', 'price': np.float64(1.5)})
+    writer.write({'symbol': 'WXYZ', 'price': 2.0})
+    
+    # Readers keep the previous file until the run commits
+    assert orjson.loads(target.read_bytes()) == [{'symbol': 'OLD'}]
+    writer.commit()
+    
+    assert orjson.loads(target.read_bytes()) == [{'symbol': 'ABCD', 'price': 1.5}, {'symbol': 'WXYZ', 'price': 2.0}]
+    assert not writer.partial_path.exists()
+
+
+@pytest.mark.parametrize('discard', [False, True])
+def test_market_data_writer_abort_leaves_the_target_alone(tmp_path, discard):
+    target = tmp_path / 'market_data.json'
+    writer = MarketDataWriter(target)
+    writer.write({'symbol': 'ABCD'})
+    writer.abort(discard=discard)
+    
+    assert not target.exists()
+    assert writer.partial_path.exists() is not discard
+
+
+def test_load_partial_resumes_today_from_an_interrupted_run(tmp_path):
+    target = tmp_path / 'market_data.json'
+    now = datetime.now()
+    writer = MarketDataWriter(target)
+    writer.write({'symbol': 'ABCD', 'timestamp': now.strftime('%Y-%m-%d %H:%M:%S')})
+    writer.write({'symbol': 'OLD', 'timestamp': (now - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')})
+    writer.write({'symbol': 'WXYZ', 'timestamp': now.strftime('%Y-%m-%d %H:%M:%S')})
+    # Killed before commit: the array is never closed
+    writer.abort()
+    
+    assert sorted(MarketDataWriter.load_partial(target)) == ['ABCD', 'WXYZ']
+
+
+def test_load_partial_tolerates_a_write_cut_after_the_separator(tmp_path):
+    target = tmp_path / 'market_data.json'
+    today = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    partial = target.with_name('market_data.collecting.json')
+    partial.write_bytes(b'[\n' + orjson.dumps({'symbol': 'ABCD', 'timestamp': today}) + b',\n')
+    assert list(MarketDataWriter.load_partial(target)) == ['ABCD']
+
+
+@pytest.mark.parametrize('content', [None, b'', b'[\n{"symbol": "ABCD", "timest'])
+def test_load_partial_starts_over_without_a_readable_file(tmp_path, content):
+    target = tmp_path / 'market_data.json'
+    if content is not None:
+        target.with_name('market_data.collecting.json').write_bytes(content)
+    assert MarketDataWriter.load_partial(target) == {}
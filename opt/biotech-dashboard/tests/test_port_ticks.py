@@ -0,0 +1,37 @@
+import importlib.util
+from pathlib import Path
+
+import orjson
+
+PORT_TICKS = Path(__file__).resolve().parents[3] / 'util_scripts' / 'port_ticks.py'
+
+
+def load_port_ticks():
+    spec = importlib.util.spec_from_file_location('port_ticks', PORT_TICKS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_first_record_wins_and_existing_details_are_kept(tmp_path, monkeypatch):
+    (tmp_path / 'market_data.json').write_bytes(orjson.dumps([
+        {'symbol': 'ABCD', 'sector': 'Healthcare', 'names': {'long': 'Abcd Therapeutics Inc.', 'short': 'Abcd'}},
+        {'symbol': 'ABCD', 'sector': 'Duplicate', 'names': {'long': 'Later Record'}},
+        {'symbol': 'WXYZ', 'sector': 'Healthcare', 'names': {'long': 'Wxyz Devices'}},
+    ]))
+    (tmp_path / 'tickers.json').write_bytes(orjson.dumps({
+        'tickers': ['WXYZ'],
+        'ticker_details': {'WXYZ': {'name': 'Hand-edited name'}},
+    }))
+    monkeypatch.chdir(tmp_path)
+    
+    load_port_ticks().update_ticker_details()
+    
+    details = orjson.loads((tmp_path / 'tickers.json').read_bytes())['ticker_details']
+    assert details['WXYZ'] == {'name': 'Hand-edited name'}
+    assert details['ABCD'] == {
+        'name': 'Abcd Therapeutics Inc.',
+        'sector': 'Healthcare',
+        'industry': '',
+        'names': {'polygon': '', 'yfinance': 'Abcd Therapeutics Inc.', 'short': 'Abcd'},
+    }
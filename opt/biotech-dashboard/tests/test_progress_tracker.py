@@ -0,0 +1,26 @@
+from scripts.progress_tracker import ProgressTracker
+
+
+def test_restore_applies_a_snapshot_and_notifies():
+    source = ProgressTracker()
+    source.start_collection(4)
+    source.update_progress('ABCD')
+    
+    mirror = ProgressTracker()
+    notified = []
+    mirror.add_listener(lambda: notified.append(mirror.get_status()))
+    mirror.restore(source.snapshot())
+    
+    assert mirror.snapshot() == source.snapshot()
+    assert notified[-1]['status'] == 'running'
+    assert notified[-1]['current_ticker'] == 'ABCD'
+    assert notified[-1]['progress'] == 25.0
+
+
+def test_restore_ignores_unknown_and_missing_keys():
+    tracker = ProgressTracker()
+    tracker.restore({'processed_tickers': 3, '_listeners': None})
+    
+    assert tracker.processed_tickers == 3
+    assert tracker.total_tickers == 0
+    assert tracker._listeners == []
@@ -0,0 +1,30 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from api import server
+
+
+@pytest.fixture
+def client(monkeypatch):
+    collections = []
+    
+    async def run_data_collection():
+        collections.append(server.progress_tracker.get_status())
+    
+    monkeypatch.setattr(server, 'run_data_collection', run_data_collection)
+    # No lifespan: the collector pool and Polygon.io client aren't needed to start a refresh
+    client = TestClient(server.app)
+    client.collections = collections
+    yield client
+    server.progress_tracker.reset()
+
+
+def test_refresh_is_marked_running_before_the_response(client):
+    first = client.post('/api/market-data/refresh')
+    assert first.status_code == 200
+    assert client.collections[0]['status'] == 'running'
+    
+    # The background task has run but not finished the collection, so a second refresh must be refused
+    second = client.post('/api/market-data/refresh')
+    assert second.status_code == 409
+    assert len(client.collections) == 1
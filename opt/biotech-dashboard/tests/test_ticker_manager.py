@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from scripts.ticker_manager import POLYGON_BASE_URL, TickerManager
+
+
+def write_tickers(path, details):
+    path.write_text(json.dumps({'tickers': sorted(details), 'ticker_details': details}))
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = TickerManager()
+    manager.tickers_file = tmp_path / 'tickers.json'
+    return manager
+
+
+def test_match_stored_checks_every_field(manager):
+    write_tickers(manager.tickers_file, {
+        'ABCD': {'name': 'Abcd Therapeutics', 'sector': 'Healthcare', 'industry': 'Biotechnology'},
+        'WXYZ': {'name': 'Wxyz Devices', 'sector': 'Healthcare', 'industry': 'Medical Devices'},
+    })
+
+    assert [symbol for symbol, _ in manager.match_stored('abcd')] == ['ABCD']
+    assert [symbol for symbol, _ in manager.match_stored(' devices ')] == ['WXYZ']
+    assert sorted(symbol for symbol, _ in manager.match_stored('health')) == ['ABCD', 'WXYZ']
+    # Fields are joined with NUL, so a query can't straddle the symbol and the name
+    assert manager.match_stored('DABCD') == []
+
+
+def test_match_stored_sees_edits_made_outside_the_manager(manager):
+    write_tickers(manager.tickers_file, {'ABCD': {'name': 'Abcd Therapeutics'}})
+    assert [symbol for symbol, _ in manager.match_stored('abcd')] == ['ABCD']
+
+    write_tickers(manager.tickers_file, {
+        'ABCD': {'name': 'Abcd Therapeutics'},
+        'EFGH': {'name': 'Efgh Pharma'},
+    })
+    assert [symbol for symbol, _ in manager.match_stored('efgh')] == ['EFGH']
+
+
+def test_match_stored_rejects_shared_trigrams_out_of_order(manager):
+    write_tickers(manager.tickers_file, {
+        'XBCD': {'name': 'Ycda Labs'},
+        'BCDA': {'name': 'Bcda Bio'},
+    })
+
+    # XBCD's haystack has both BCD and CDA, but never the substring BCDA
+    assert [symbol for symbol, _ in manager.match_stored('bcda')] == ['BCDA']
+
+
+def test_match_stored_scans_queries_shorter_than_a_trigram(manager):
+    write_tickers(manager.tickers_file, {
+        'ABCD': {'name': 'Abcd Therapeutics'},
+        'WXYZ': {'name': 'Wxyz Devices'},
+    })
+
+    assert [symbol for symbol, _ in manager.match_stored('yz')] == ['WXYZ']
+    assert [symbol for symbol, _ in manager.match_stored('e')] == ['ABCD', 'WXYZ']
+
+
+def test_only_polygon_requests_are_retried(manager):
+    polygon = manager._session.get_adapter(POLYGON_BASE_URL + '/v3/reference/tickers/ABCD')
+    yahoo = manager._session.get_adapter('https://query2.finance.yahoo.com/v10/finance/quoteSummary/ABCD')
+
+    assert polygon.max_retries.total == 3
+    assert 429 in polygon.max_retries.status_forcelist
+    assert yahoo.max_retries.total == 0
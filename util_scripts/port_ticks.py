@@ -1,4 +1,4 @@
-import json
+import orjson
 import os
 
 def update_ticker_details():
@@ -9,8 +9,8 @@ def update_ticker_details():
 
     # Read the market data
     try:
-        with open('market_data.json', 'r') as f:
-            market_data = json.load(f)
+        with open('market_data.json', 'rb') as f:
+            market_data = orjson.loads(f.read())
             print("Successfully read market_data.json")
     except FileNotFoundError:
         print("Error: market_data.json not found")
@@ -19,41 +19,43 @@ def update_ticker_details():
     
     # Read the existing tickers file
     try:
-        with open('tickers.json', 'r') as f:
-            tickers_data = json.load(f)
+        with open('tickers.json', 'rb') as f:
+            tickers_data = orjson.loads(f.read())
             print("Successfully read tickers.json")
     except FileNotFoundError:
         print("Error: tickers.json not found")
         print(f"Looked for file at: {os.path.abspath('tickers.json')}")
         return
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Error decoding tickers.json: {e}")
         return
     
-    # For each stock in market data
+    # Build entries for stocks not already present, using the new names structure
+    existing = tickers_data['ticker_details']
+    # The first record wins when market data repeats a symbol
+    first_records = {}
     for stock in market_data:
-        symbol = stock['symbol']
-        
-        # Create ticker detail entry using the new names structure
-        ticker_detail = {
-            "name": stock.get('names', {}).get('long', ''),
+        first_records.setdefault(stock['symbol'], stock)
+    new_entries = {
+        symbol: {
+            "name": (names := stock.get('names', {})).get('long', ''),
             "sector": stock.get('sector', ''),
             "industry": stock.get('industry', ''),
             "names": {
-                "polygon": stock.get('names', {}).get('polygon', ''),
-                "yfinance": stock.get('names', {}).get('long', ''),
-                "short": stock.get('names', {}).get('short', '')
+                "polygon": names.get('polygon', ''),
+                "yfinance": names.get('long', ''),
+                "short": names.get('short', '')
             }
         }
-        
-        # Add to ticker_details if not already present
-        if symbol not in tickers_data['ticker_details']:
-            tickers_data['ticker_details'][symbol] = ticker_detail
+        for symbol, stock in first_records.items()
+        if symbol not in existing
+    }
+    existing.update(new_entries)
     
     # Write updated data back to tickers.json
     try:
-        with open('tickers.json', 'w') as f:
-            json.dump(tickers_data, f, indent=2)
+        with open('tickers.json', 'wb') as f:
+            f.write(orjson.dumps(tickers_data, option=orjson.OPT_INDENT_2))
         print("Successfully updated ticker details")
     except Exception as e:
         print(f"Error writing to tickers.json: {e}")